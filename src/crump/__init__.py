@@ -33,6 +33,7 @@ from crump.config import (
 )
 from crump.database import (
     DryRunSummary,
+    shutdown_pools,
     sync_csv_to_db,
     sync_csv_to_db_dry_run,
 )
@@ -50,6 +51,7 @@ __all__ = [
     "sync_csv_to_db",
     "sync_csv_to_db_dry_run",
     "DryRunSummary",
+    "shutdown_pools",
     # Type detection
     "analyze_csv_types_and_nullable",
     "suggest_id_column",
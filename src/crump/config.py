@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import copy
 import importlib
 import re
+import sys
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
 
 import yaml  # type: ignore[import-untyped]
 
+# libyaml's C parser and emitter when PyYAML was built with it, else the
+# pure-Python ones
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-class DuplicateKeySafeLoader(yaml.SafeLoader):
+
+class DuplicateKeySafeLoader(_SafeLoader):  # type: ignore[misc,valid-type,unused-ignore]
     """Custom YAML loader that handles duplicate null keys by converting them to a list."""
 
     pass
@@ -46,10 +56,65 @@ DuplicateKeySafeLoader.add_constructor(
     yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, dict_constructor
 )
 
+# Default for dict lookups where a key that is present but null is not missing
+_MISSING = object()
+
+
+@overload
+def _intern(name: str) -> str: ...
+
+
+@overload
+def _intern(name: None) -> None: ...
+
+
+def _intern(name: str | None) -> str | None:
+    """Intern a column or table name.
+
+    The same few names recur across the mappings and jobs of a config, so
+    interning lets them share one string object each. None, for computed
+    columns, and names YAML parsed as something other than a string are
+    returned unchanged.
+    """
+    if type(name) is str:
+        return sys.intern(name)
+    return name
+
+
+@lru_cache(maxsize=64)
+def _load_yaml_file(key: tuple[str, int, int]) -> Any:
+    """Parse a YAML config file, caching the result.
+
+    The modification time and size are part of the cache key, so an edited
+    file is parsed again. Callers must copy the result before handing any of
+    it out, as the cached object is shared.
+
+    Args:
+        key: Tuple of (absolute path, modification time in ns, size in bytes)
+
+    Returns:
+        The parsed YAML document
+    """
+    # One read, and libyaml decodes the UTF-8 itself rather than pulling the
+    # text through a Python file object chunk by chunk
+    return yaml.load(Path(key[0]).read_bytes(), Loader=DuplicateKeySafeLoader)
+
 
 class ColumnMapping:
     """Mapping between CSV and database columns."""
 
+    # A job has one of these per column, so they are kept small
+    __slots__ = (
+        "csv_column",
+        "data_type",
+        "db_column",
+        "expression",
+        "function",
+        "input_columns",
+        "lookup",
+        "nullable",
+    )
+
     def __init__(
         self,
         csv_column: str | None,
@@ -91,8 +156,8 @@ class ColumnMapping:
         if (expression is not None or function is not None) and not input_columns:
             raise ValueError("Must specify 'input_columns' when using 'expression' or 'function'")
 
-        self.csv_column = csv_column
-        self.db_column = db_column
+        self.csv_column = _intern(csv_column)
+        self.db_column = _intern(db_column)
         self.data_type = data_type
         self.nullable = nullable
         self.lookup = lookup
@@ -191,6 +256,8 @@ class ColumnMapping:
 class FilenameColumnMapping:
     """Mapping for a single column extracted from filename."""
 
+    __slots__ = ("data_type", "db_column", "name", "use_to_delete_old_rows")
+
     def __init__(
         self,
         name: str,
@@ -206,8 +273,8 @@ class FilenameColumnMapping:
             data_type: Data type (varchar(N), integer, float, date, datetime, text)
             use_to_delete_old_rows: If True, this column is used to identify stale rows
         """
-        self.name = name
-        self.db_column = db_column or name
+        self.name = _intern(name)
+        self.db_column = _intern(db_column or name)
         self.data_type = data_type
         self.use_to_delete_old_rows = use_to_delete_old_rows
 
@@ -302,6 +369,8 @@ class FilenameToColumn:
 class IndexColumn:
     """Column definition for a database index."""
 
+    __slots__ = ("column", "order")
+
     def __init__(self, column: str, order: str = "ASC") -> None:
         """Initialize index column.
 
@@ -314,13 +383,15 @@ class IndexColumn:
         """
         if order.upper() not in ("ASC", "DESC"):
             raise ValueError(f"Index order must be 'ASC' or 'DESC', got '{order}'")
-        self.column = column
+        self.column = _intern(column)
         self.order = order.upper()
 
 
 class Index:
     """Database index configuration."""
 
+    __slots__ = ("columns", "name")
+
     def __init__(self, name: str, columns: list[IndexColumn]) -> None:
         """Initialize index.
 
@@ -363,20 +434,46 @@ class CrumpJob:
                               syncs all rows. Values like 10 mean 1 in every 10 rows.
                               Always includes first and last row.
         """
-        self.name = name
-        self.target_table = target_table
+        self.name = _intern(name)
+        self.target_table = _intern(target_table)
         self.id_mapping = id_mapping
         self.columns = columns or []
         self.filename_to_column = filename_to_column
         self.indexes = indexes or []
         self.sample_percentage = sample_percentage
 
+        # Built on the first get_column call, for the list it was built from
+        self._columns_by_csv: dict[str, ColumnMapping] = {}
+        self._indexed_columns: list[ColumnMapping] | None = None
+
         # Validate sample_percentage
         if sample_percentage is not None and not (0 <= sample_percentage <= 100):
             raise ValueError(
                 f"sample_percentage must be between 0 and 100, got {sample_percentage}"
             )
 
+    def get_column(self, csv_column: str) -> ColumnMapping | None:
+        """Get the column mapping for a CSV column.
+
+        Looks the name up in a dict built once from the columns list, rather
+        than scanning the list. The dict is rebuilt if the list is replaced,
+        but not if it is changed in place.
+
+        Args:
+            csv_column: Name of the column in the CSV file
+
+        Returns:
+            The first column mapping for that CSV column, or None if it has none
+        """
+        if self._indexed_columns is not self.columns:
+            by_csv: dict[str, ColumnMapping] = {}
+            for col in self.columns:
+                if col.csv_column is not None:
+                    by_csv.setdefault(col.csv_column, col)
+            self._columns_by_csv = by_csv
+            self._indexed_columns = self.columns
+        return self._columns_by_csv.get(csv_column)
+
 
 class CrumpConfig:
     """Configuration for data synchronization."""
@@ -506,11 +603,16 @@ class CrumpConfig:
                       - column: observation_date
                         order: DESC
         """
-        if not config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {config_path}")
-
-        with open(config_path, encoding="utf-8") as f:
-            data = yaml.load(f, Loader=DuplicateKeySafeLoader)
+        try:
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+        # Loading the same unchanged file again reuses the parsed YAML. The copy
+        # keeps the returned config from sharing mutable lists with the cache.
+        data = copy.deepcopy(
+            _load_yaml_file((str(config_path.resolve()), stat.st_mtime_ns, stat.st_size))
+        )
 
         if not data or "jobs" not in data:
             raise ValueError("Config file must contain 'jobs' section")
@@ -522,7 +624,7 @@ class CrumpConfig:
 
         jobs = {}
         for job_name, job_data in data["jobs"].items():
-            jobs[job_name] = cls._parse_job(job_name, job_data)
+            jobs[_intern(job_name)] = cls._parse_job(job_name, job_data)
 
         return cls(jobs=jobs, id_column_matchers=id_column_matchers)
 
@@ -615,15 +717,20 @@ class CrumpConfig:
         Raises:
             ValueError: If job configuration is invalid
         """
-        if "target_table" not in job_data:
+        if not isinstance(job_data, dict):
+            raise ValueError(f"Job '{name}' must be a dictionary")
+
+        # Each key is looked up once; _MISSING tells an absent key from a null one
+        target_table = job_data.get("target_table", _MISSING)
+        if target_table is _MISSING:
             raise ValueError(f"Job '{name}' missing 'target_table'")
 
-        if "id_mapping" not in job_data:
+        id_data = job_data.get("id_mapping", _MISSING)
+        if id_data is _MISSING:
             raise ValueError(f"Job '{name}' missing 'id_mapping'")
 
         # Parse id_mapping as a dict: {csv_column: db_column} or {csv_column: {db_column: x, type: y}}
         # Supports multiple columns for compound primary keys
-        id_data = job_data["id_mapping"]
         if not isinstance(id_data, dict):
             raise ValueError(f"Job '{name}' id_mapping must be a dictionary")
 
@@ -636,8 +743,8 @@ class CrumpConfig:
 
         # Parse columns as a dict: {csv_column: db_column} or {csv_column: {db_column: x, type: y}}
         columns = []
-        if "columns" in job_data and job_data["columns"]:
-            col_data = job_data["columns"]
+        col_data = job_data.get("columns")
+        if col_data:
             if not isinstance(col_data, dict):
                 raise ValueError(f"Job '{name}' columns must be a dictionary")
 
@@ -651,14 +758,16 @@ class CrumpConfig:
 
         # Parse optional filename_to_column
         filename_to_column = None
-        if "filename_to_column" in job_data and job_data["filename_to_column"]:
-            ftc_data = job_data["filename_to_column"]
+        ftc_data = job_data.get("filename_to_column")
+        if ftc_data:
             if not isinstance(ftc_data, dict):
                 raise ValueError(f"Job '{name}' filename_to_column must be a dictionary")
 
             # Check that exactly one of template or regex is specified
-            has_template = "template" in ftc_data and ftc_data["template"]
-            has_regex = "regex" in ftc_data and ftc_data["regex"]
+            template = ftc_data.get("template")
+            regex = ftc_data.get("regex")
+            has_template = bool(template)
+            has_regex = bool(regex)
 
             if not has_template and not has_regex:
                 raise ValueError(
@@ -671,14 +780,15 @@ class CrumpConfig:
                 )
 
             # Parse columns
-            if "columns" not in ftc_data or not ftc_data["columns"]:
+            ftc_columns_data = ftc_data.get("columns")
+            if not ftc_columns_data:
                 raise ValueError(f"Job '{name}' filename_to_column must have 'columns'")
 
-            if not isinstance(ftc_data["columns"], dict):
+            if not isinstance(ftc_columns_data, dict):
                 raise ValueError(f"Job '{name}' filename_to_column columns must be a dictionary")
 
             ftc_columns = {}
-            for col_name, col_data in ftc_data["columns"].items():
+            for col_name, col_data in ftc_columns_data.items():
                 if isinstance(col_data, dict):
                     db_column = col_data.get("db_column")
                     data_type = col_data.get("type")
@@ -702,14 +812,14 @@ class CrumpConfig:
 
             filename_to_column = FilenameToColumn(
                 columns=ftc_columns,
-                template=ftc_data.get("template"),
-                regex=ftc_data.get("regex"),
+                template=template,
+                regex=regex,
             )
 
         # Parse optional indexes
         indexes = []
-        if "indexes" in job_data and job_data["indexes"]:
-            indexes_data = job_data["indexes"]
+        indexes_data = job_data.get("indexes")
+        if indexes_data:
             if not isinstance(indexes_data, list):
                 raise ValueError(f"Job '{name}' indexes must be a list")
 
@@ -717,29 +827,31 @@ class CrumpConfig:
                 if not isinstance(idx_data, dict):
                     raise ValueError(f"Job '{name}' index entry must be a dictionary")
 
-                if "name" not in idx_data:
+                idx_name = idx_data.get("name", _MISSING)
+                if idx_name is _MISSING:
                     raise ValueError(f"Job '{name}' index missing 'name'")
 
-                if "columns" not in idx_data:
+                idx_columns_data = idx_data.get("columns", _MISSING)
+                if idx_columns_data is _MISSING:
                     raise ValueError(f"Job '{name}' index missing 'columns'")
 
                 idx_columns = []
-                for col_data in idx_data["columns"]:
+                for col_data in idx_columns_data:
                     if not isinstance(col_data, dict):
                         raise ValueError(f"Job '{name}' index column must be a dictionary")
 
-                    if "column" not in col_data:
+                    column = col_data.get("column", _MISSING)
+                    if column is _MISSING:
                         raise ValueError(f"Job '{name}' index column missing 'column' field")
 
                     order = col_data.get("order", "ASC")
-                    idx_columns.append(IndexColumn(column=col_data["column"], order=order))
+                    idx_columns.append(IndexColumn(column=column, order=order))
 
-                indexes.append(Index(name=idx_data["name"], columns=idx_columns))
+                indexes.append(Index(name=idx_name, columns=idx_columns))
 
         # Parse optional sample_percentage
-        sample_percentage = None
-        if "sample_percentage" in job_data and job_data["sample_percentage"] is not None:
-            sample_percentage = job_data["sample_percentage"]
+        sample_percentage = job_data.get("sample_percentage")
+        if sample_percentage is not None:
             # Validate it's a number
             if not isinstance(sample_percentage, (int, float)):
                 raise ValueError(f"Job '{name}' sample_percentage must be a number")
@@ -750,7 +862,7 @@ class CrumpConfig:
 
         return CrumpJob(
             name=name,
-            target_table=job_data["target_table"],
+            target_table=target_table,
             id_mapping=id_mapping,
             columns=columns if columns else None,
             filename_to_column=filename_to_column,
@@ -915,7 +1027,7 @@ class CrumpConfig:
         config_dict = self.to_yaml_dict()
 
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_dict, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
 
 
 def apply_row_transformations(
@@ -929,9 +1041,14 @@ def apply_row_transformations(
     This is a shared helper function used by both sync and extract operations
     to apply the same transformations consistently.
 
+    Callers must validate ``sync_columns`` against the CSV header once up front:
+    every mapping with a ``csv_column`` is read from the row without a per-row
+    membership check.
+
     Args:
         row: Dictionary representing a CSV row (column_name -> value)
-        sync_columns: List of ColumnMapping objects defining transformations
+        sync_columns: List of ColumnMapping objects defining transformations, already
+                      validated to only reference columns present in the CSV
         filename_to_column: Optional FilenameToColumn configuration
         filename_values: Optional dict of values extracted from filename
 
@@ -946,7 +1063,7 @@ def apply_row_transformations(
         if col_mapping.expression or col_mapping.function:
             # Apply custom function/expression
             row_data[col_mapping.db_column] = col_mapping.apply_custom_function(row)
-        elif col_mapping.csv_column and col_mapping.csv_column in row:
+        elif col_mapping.csv_column:
             csv_value = row[col_mapping.csv_column]
             # Apply lookup transformation if configured
             row_data[col_mapping.db_column] = col_mapping.apply_lookup(csv_value)
@@ -958,3 +1075,105 @@ def apply_row_transformations(
                 row_data[filename_col_mapping.db_column] = filename_values[col_name]
 
     return row_data
+
+
+def build_row_transformer(
+    fieldnames: Sequence[str],
+    sync_columns: list[ColumnMapping],
+    filename_to_column: FilenameToColumn | None = None,
+    filename_values: dict[str, str] | None = None,
+) -> tuple[list[str], Callable[[Sequence[str]], tuple[Any, ...]]]:
+    """Build a function applying column transformations to ``csv.reader`` rows.
+
+    The returned function gives the same values as apply_row_transformations on
+    the equivalent DictReader row, in the same column order, but column
+    positions are resolved from the header once and each row becomes a tuple,
+    with no dict built or hashed per row.
+
+    Args:
+        fieldnames: CSV header row
+        sync_columns: List of ColumnMapping objects defining transformations, already
+                      validated to only reference columns present in the CSV
+        filename_to_column: Optional FilenameToColumn configuration
+        filename_values: Optional dict of values extracted from filename
+
+    Returns:
+        Tuple of (db_columns, transform) where transform maps a list of CSV values
+        to a tuple of values for db_columns. Rows must be non-empty; short rows
+        read missing trailing values as None, as DictReader does.
+    """
+    # Later duplicates win, matching DictReader
+    positions = {name: index for index, name in enumerate(fieldnames)}
+    width = len(fieldnames)
+
+    # One step per output column, keyed and ordered as apply_row_transformations
+    # fills its dict: (mapping, position) for plain columns, (mapping,
+    # [(input_column, position), ...]) for custom functions and expressions, and
+    # (None, value) for constants taken from the filename
+    steps: dict[str, tuple[ColumnMapping | None, Any]] = {}
+    for col_mapping in sync_columns:
+        if col_mapping.expression or col_mapping.function:
+            # Unknown input columns are left out so apply_custom_function reports them
+            inputs = [
+                (name, positions[name])
+                for name in col_mapping.input_columns or []
+                if name in positions
+            ]
+            steps[col_mapping.db_column] = (col_mapping, inputs)
+        elif col_mapping.csv_column:
+            steps[col_mapping.db_column] = (col_mapping, positions[col_mapping.csv_column])
+
+    if filename_to_column and filename_values:
+        for col_name, filename_col_mapping in filename_to_column.columns.items():
+            if col_name in filename_values:
+                steps[filename_col_mapping.db_column] = (None, filename_values[col_name])
+
+    step_list = list(steps.values())
+
+    # Fast path for the common shape: plain columns without lookups, then any
+    # filename constants. itemgetter picks the values out in a single C call.
+    plain_count = next(
+        (
+            index
+            for index, (col_mapping, source) in enumerate(step_list)
+            if col_mapping is None or not isinstance(source, int) or col_mapping.lookup
+        ),
+        len(step_list),
+    )
+    if plain_count and all(col_mapping is None for col_mapping, _ in step_list[plain_count:]):
+        select = itemgetter(*(source for _, source in step_list[:plain_count]))
+        constants = tuple(source for _, source in step_list[plain_count:])
+
+        def pick(row: Sequence[Any]) -> tuple[Any, ...]:
+            picked = select(row)
+            # itemgetter returns a bare value rather than a tuple for one column
+            return (picked, *constants) if plain_count == 1 else picked + constants
+
+        def transform_plain(csv_row: Sequence[str]) -> tuple[Any, ...]:
+            try:
+                return pick(csv_row)
+            except IndexError:
+                return pick([*csv_row, *([None] * (width - len(csv_row)))])
+
+        return list(steps), transform_plain
+
+    def transform(csv_row: Sequence[str]) -> tuple[Any, ...]:
+        row: Sequence[Any] = csv_row
+        if len(row) < width:
+            row = [*row, *([None] * (width - len(row)))]
+
+        values = []
+        for col_mapping, source in step_list:
+            if col_mapping is None:
+                values.append(source)
+            elif isinstance(source, int):
+                values.append(col_mapping.apply_lookup(row[source]))
+            else:
+                values.append(
+                    col_mapping.apply_custom_function(
+                        {name: row[position] for name, position in source}
+                    )
+                )
+        return tuple(values)
+
+    return list(steps), transform
@@ -4,6 +4,27 @@ import csv
 import re
 from pathlib import Path
 
+# Number of values per column that type detection looks at
+_SAMPLE_SIZE = 1000
+
+# Date and datetime formats recognised by type detection, compiled once and
+# combined so each value is matched against a single pattern
+_DATE_RE = re.compile(
+    r"^(?:"
+    r"\d{4}-\d{2}-\d{2}"  # YYYY-MM-DD
+    r"|\d{4}/\d{2}/\d{2}"  # YYYY/MM/DD
+    r"|\d{2}-\d{2}-\d{4}"  # DD-MM-YYYY
+    r"|\d{2}/\d{2}/\d{4}"  # DD/MM/YYYY or MM/DD/YYYY
+    r")$"
+)
+_DATETIME_RE = re.compile(
+    r"^(?:"
+    r"\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}"  # YYYY-MM-DD HH:MM:SS
+    r"|\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}"  # ISO format
+    r"|\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}"  # MM/DD/YYYY HH:MM:SS
+    r")"
+)
+
 
 def detect_column_type(values: list[str]) -> str:
     """Detect the most appropriate data type for a column based on sample values.
@@ -14,34 +35,46 @@ def detect_column_type(values: list[str]) -> str:
     Returns:
         Detected type: 'integer', 'float', 'date', 'datetime', 'text', or 'varchar(N)'
     """
-    if not values:
+    # Sample up to 1000 values for performance, checking every type in one pass.
+    # Each flag stays set while all values so far have that type.
+    is_integer = is_float = is_date = is_datetime = True
+    max_length = 0
+    seen_value = False
+    for value in values[:_SAMPLE_SIZE]:
+        # Date patterns are matched against values without surrounding whitespace
+        stripped = value.strip()
+        if not stripped:
+            continue
+        seen_value = True
+        if len(value) > max_length:
+            max_length = len(value)
+
+        if is_integer and not _is_integer(value):
+            is_integer = False
+        # Every integer is also a float
+        if is_float and not is_integer and not _is_float(value):
+            is_float = False
+        if is_date and not _is_date(stripped):
+            is_date = False
+        if is_datetime and not _is_datetime(stripped):
+            is_datetime = False
+
+        # Too long for varchar and no other type left
+        if max_length > 255 and not (is_integer or is_float or is_date or is_datetime):
+            return "text"
+
+    if not seen_value:
         return "text"
-
-    # Sample up to 1000 values for performance
-    sample = values[:1000]
-    non_empty = [v for v in sample if v.strip()]
-
-    if not non_empty:
-        return "text"
-
-    # Check if all values are integers
-    if all(_is_integer(v) for v in non_empty):
+    if is_integer:
         return "integer"
-
-    # Check if all values are floats
-    if all(_is_float(v) for v in non_empty):
+    if is_float:
         return "float"
-
-    # Check if all values are dates
-    if all(_is_date(v) for v in non_empty):
+    if is_date:
         return "date"
-
-    # Check if all values are datetimes
-    if all(_is_datetime(v) for v in non_empty):
+    if is_datetime:
         return "datetime"
 
     # Check if it's a short text field (could use varchar)
-    max_length = max(len(v) for v in non_empty)
     if max_length <= 255:
         return f"varchar({max_length})"
 
@@ -50,6 +83,11 @@ def detect_column_type(values: list[str]) -> str:
 
 def _is_integer(value: str) -> bool:
     """Check if a string represents an integer."""
+    # Plain digits, optionally signed, are the common case and always parse, so
+    # skip the exception machinery for them; anything else (whitespace,
+    # underscores, ...) is left to int() to decide
+    if value.isdecimal() or (value[:1] in ("-", "+") and value[1:].isdecimal()):
+        return True
     try:
         int(value)
         return True
@@ -59,6 +97,10 @@ def _is_integer(value: str) -> bool:
 
 def _is_float(value: str) -> bool:
     """Check if a string represents a float."""
+    # As for integers, plain decimals like 1.5 or -0.25 always parse
+    unsigned = value[1:] if value[:1] in ("-", "+") else value
+    if unsigned.replace(".", "", 1).isdecimal():
+        return True
     try:
         float(value)
         return True
@@ -67,28 +109,13 @@ def _is_float(value: str) -> bool:
 
 
 def _is_date(value: str) -> bool:
-    """Check if a string represents a date (YYYY-MM-DD format)."""
-    # Common date patterns
-    date_patterns = [
-        r"^\d{4}-\d{2}-\d{2}$",  # YYYY-MM-DD
-        r"^\d{4}/\d{2}/\d{2}$",  # YYYY/MM/DD
-        r"^\d{2}-\d{2}-\d{4}$",  # DD-MM-YYYY
-        r"^\d{2}/\d{2}/\d{4}$",  # DD/MM/YYYY or MM/DD/YYYY
-    ]
-
-    return any(re.match(pattern, value.strip()) for pattern in date_patterns)
+    """Check if a stripped string represents a date (e.g. YYYY-MM-DD)."""
+    return _DATE_RE.match(value) is not None
 
 
 def _is_datetime(value: str) -> bool:
-    """Check if a string represents a datetime."""
-    # Common datetime patterns
-    datetime_patterns = [
-        r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}",  # YYYY-MM-DD HH:MM:SS
-        r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",  # ISO format
-        r"^\d{2}/\d{2}/\d{4}\s+\d{2}:\d{2}:\d{2}",  # MM/DD/YYYY HH:MM:SS
-    ]
-
-    return any(re.match(pattern, value.strip()) for pattern in datetime_patterns)
+    """Check if a stripped string represents a datetime."""
+    return _DATETIME_RE.match(value) is not None
 
 
 def detect_nullable(values: list[str], total_rows: int) -> bool:
@@ -105,71 +132,85 @@ def detect_nullable(values: list[str], total_rows: int) -> bool:
     return len(values) < total_rows
 
 
-def analyze_csv_types(csv_path: Path) -> dict[str, str]:
-    """Analyze a CSV file and detect data types for each column.
+def _sample_csv_columns(
+    csv_path: Path, skip_blank: bool
+) -> tuple[dict[str, list[str]], dict[str, int], int]:
+    """Read a CSV once, keeping only the values type detection will look at.
+
+    Only the first _SAMPLE_SIZE values of each column are kept, since that is all
+    detect_column_type samples; the rest are just counted. Memory stays bounded
+    by the number of columns rather than the size of the file.
 
     Args:
         csv_path: Path to the CSV file
+        skip_blank: Whether whitespace-only values count as empty
 
     Returns:
-        Dictionary mapping column names to detected types
+        Tuple of (samples, value_counts, total_rows), where samples and
+        value_counts are keyed by column name in header order
     """
-    column_values: dict[str, list[str]] = {}
-
     with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
 
-        if not reader.fieldnames:
-            return {}
+        # A repeated column name takes its values from the last occurrence, as
+        # with DictReader
+        positions = {col: index for index, col in enumerate(header)}
+        samples: dict[str, list[str]] = {col: [] for col in positions}
+        counts = dict.fromkeys(positions, 0)
+        columns = [(col, index, samples[col]) for col, index in positions.items()]
+        total_rows = 0
 
-        # Initialize empty lists for each column
-        for col in reader.fieldnames:
-            column_values[col] = []
-
-        # Collect values for each column
         for row in reader:
-            for col in reader.fieldnames:
-                if col in row and row[col]:
-                    column_values[col].append(row[col])
+            # DictReader skips blank lines
+            if not row:
+                continue
+            total_rows += 1
+            row_length = len(row)
+            for col, index, sample in columns:
+                if index >= row_length:
+                    continue
+                value = row[index]
+                if not value or (skip_blank and not value.strip()):
+                    continue
+                counts[col] += 1
+                if len(sample) < _SAMPLE_SIZE:
+                    sample.append(value)
 
-    # Detect type for each column
-    return {col: detect_column_type(values) for col, values in column_values.items()}
+    return samples, counts, total_rows
 
 
-def analyze_csv_types_and_nullable(csv_path: Path) -> dict[str, tuple[str, bool]]:
-    """Analyze a CSV file and detect data types and nullable status for each column.
+def analyze_csv_types(csv_path: Path) -> dict[str, str]:
+    """Analyze a CSV file and detect data types for each column.
 
     Args:
         csv_path: Path to the CSV file
 
     Returns:
-        Dictionary mapping column names to (data_type, nullable) tuples
+        Dictionary mapping column names to detected types
     """
-    column_values: dict[str, list[str]] = {}
-    total_rows = 0
+    samples, _, _ = _sample_csv_columns(csv_path, skip_blank=False)
 
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+    # Detect type for each column
+    return {col: detect_column_type(values) for col, values in samples.items()}
 
-        if not reader.fieldnames:
-            return {}
 
-        # Initialize empty lists for each column
-        for col in reader.fieldnames:
-            column_values[col] = []
+def analyze_csv_types_and_nullable(csv_path: Path) -> dict[str, tuple[str, bool]]:
+    """Analyze a CSV file and detect data types and nullable status for each column.
 
-        # Collect values for each column and count total rows
-        for row in reader:
-            total_rows += 1
-            for col in reader.fieldnames:
-                if col in row and row[col] and row[col].strip():
-                    column_values[col].append(row[col])
+    Args:
+        csv_path: Path to the CSV file
+
+    Returns:
+        Dictionary mapping column names to (data_type, nullable) tuples
+    """
+    samples, counts, total_rows = _sample_csv_columns(csv_path, skip_blank=True)
 
     # Detect type and nullable for each column
     result = {}
-    for col, values in column_values.items():
+    for col, values in samples.items():
         data_type = detect_column_type(values)
-        nullable = detect_nullable(values, total_rows)
+        nullable = counts[col] < total_rows
         result[col] = (data_type, nullable)
 
     return result
@@ -1,21 +1,84 @@
 """Pytest configuration and shared fixtures."""
 
+import os
 import platform
-
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import psycopg
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
+from psycopg import sql
 
+from crump.cli import main
+from crump.config import CrumpConfig
+from crump.database import shutdown_pools
+from tests.db_test_utils import close_pg_pools
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
     """Provide a Click CLI test runner.
 
+    The runner keeps no state between invoke calls, so one is shared by the
+    whole session.
+
     Returns:
         CliRunner instance for testing CLI commands
     """
     return CliRunner()
 
 
+@pytest.fixture(scope="session")
+def invoke_cached(cli_runner: CliRunner) -> Callable[..., Result]:
+    """Provide a CLI invoker that runs each argument list only once per session.
+
+    For output that depends only on the arguments, such as --help and
+    --version. Tests must not use it for commands that read or write files.
+
+    Returns:
+        Function taking CLI arguments and returning the (shared) click Result
+    """
+    results: dict[tuple[str, ...], Result] = {}
+
+    def invoke(*args: str) -> Result:
+        if args not in results:
+            results[args] = cli_runner.invoke(main, list(args))
+        return results[args]
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def load_config(tmp_path_factory: pytest.TempPathFactory) -> Callable[[str], CrumpConfig]:
+    """Provide a loader that builds a CrumpConfig from YAML text.
+
+    Each distinct text is written to one file in a session directory, so tests
+    need no tmp_path of their own, and loading the same text again reuses
+    CrumpConfig.from_yaml's parse cache. Every call returns a new config, so
+    tests may change it freely.
+
+    Returns:
+        Function taking YAML text and returning the loaded CrumpConfig
+    """
+    directory = tmp_path_factory.mktemp("configs")
+    paths: dict[str, Path] = {}
+
+    def load(text: str) -> CrumpConfig:
+        path = paths.get(text)
+        if path is None:
+            path = directory / f"config_{len(paths)}.yaml"
+            path.write_text(text, encoding="utf-8")
+            paths[text] = path
+        return CrumpConfig.from_yaml(path)
+
+    return load
+
+
 @pytest.fixture
 def sample_text() -> str:
     """Provide sample text for testing.
@@ -26,12 +89,24 @@ def sample_text() -> str:
     return "test input"
 
 
+@lru_cache(maxsize=1)
 def should_skip_postgres_tests():
     """Check if PostgreSQL tests should be skipped.
 
     Testcontainers has issues on Windows/macOS with Docker socket mounting.
-    Only run PostgreSQL tests on Linux (locally or in CI).
+    Only run PostgreSQL tests on Linux (locally or in CI). Set
+    SKIP_POSTGRES_TESTS to skip them without probing Docker at all.
+
+    The answer is cached, so Docker is pinged once per session rather than
+    once per parametrized test.
     """
+    if os.environ.get("SKIP_POSTGRES_TESTS"):
+        return True, "PostgreSQL tests disabled by SKIP_POSTGRES_TESTS"
+
+    # An already running server needs neither Docker nor testcontainers
+    if os.environ.get("POSTGRES_URL"):
+        return False, None
+
     system = platform.system()
 
     # Skip on Windows and macOS - testcontainers doesn't work reliably
@@ -55,6 +130,10 @@ def postgres_container_session():
 
     This fixture starts a single PostgreSQL container that is shared across
     all tests in the session, making tests much faster.
+
+    With TESTCONTAINERS_REUSE_ENABLE=true, and a testcontainers release that
+    supports reuse, the container is left running at the end of the session
+    and picked up again by the next one.
     """
     skip, reason = should_skip_postgres_tests()
     if skip:
@@ -64,97 +143,157 @@ def postgres_container_session():
 
     # Create and start container once for entire test session
     container = PostgresContainer("postgres:16-alpine")
+    reuse_enabled = os.environ.get("TESTCONTAINERS_REUSE_ENABLE", "").lower() == "true"
+    reuse = reuse_enabled and hasattr(container, "with_reuse")
+    if reuse:
+        container = container.with_reuse()
     container.start()
 
     yield container
 
-    # Stop container at end of session
-    container.stop()
+    # Stop container at end of session, unless it is kept for the next one
+    if not reuse:
+        container.stop()
+
+
+def _with_database(url: str, dbname: str) -> str:
+    """Return a PostgreSQL connection URL that names a different database."""
+    return urlsplit(url)._replace(path=f"/{dbname}").geturl()
+
+
+@contextmanager
+def _scratch_database(server_url: str) -> Iterator[str]:
+    """Create a uniquely named database on a server for the length of a block.
+
+    Each pytest-xdist worker runs its own session, so each gets its own
+    database and workers never see, or drop, each other's tables. The
+    database is dropped afterwards, once the shared connection pools that
+    still hold connections to it are closed.
+
+    Args:
+        server_url: URL of any database on the server, used only to create
+            and drop the scratch database
+
+    Yields:
+        URL of the scratch database
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    name = f"crump_test_{worker}_{uuid.uuid4().hex[:8]}"
+    with psycopg.connect(server_url, autocommit=True) as conn:
+        conn.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(name)))
+    try:
+        yield _with_database(server_url, name)
+    finally:
+        shutdown_pools()
+        close_pg_pools()
+        with psycopg.connect(server_url, autocommit=True) as conn:
+            conn.execute(
+                sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(name))
+            )
+
+
+@pytest.fixture(scope="session")
+def postgres_url_session(request):
+    """Provide the connection URL of the PostgreSQL database for the session.
+
+    Uses the server at POSTGRES_URL when it is set, e.g. one started with
+    tests/docker-compose.yml, so no container has to start during the run.
+    Otherwise starts the session's test container. Either way the tests work
+    in a scratch database on the server, dropped at the end of the session;
+    the database POSTGRES_URL names is never written to.
+    """
+    server_url = os.environ.get("POSTGRES_URL")
+    if not server_url:
+        container = request.getfixturevalue("postgres_container_session")
+        server_url = container.get_connection_url(driver=None)
+    with _scratch_database(server_url) as scratch_url:
+        yield scratch_url
+
+
+def _drop_all_tables(db_url: str) -> None:
+    """Drop every table in the public schema of a PostgreSQL database.
+
+    This resets the session's database between tests. All tables go in a
+    single DROP TABLE, so the reset costs two round trips however many tables
+    earlier tests left behind.
+    """
+    with psycopg.connect(db_url, autocommit=True) as conn:
+        tables = conn.execute("""
+            SELECT tablename FROM pg_tables
+            WHERE schemaname = 'public'
+        """).fetchall()
+        if tables:
+            conn.execute(
+                sql.SQL("DROP TABLE IF EXISTS {} CASCADE").format(
+                    sql.SQL(", ").join(sql.Identifier(table_name) for (table_name,) in tables)
+                )
+            )
 
 
 @pytest.fixture
-def postgres_db_clean(postgres_container_session):
+def postgres_db_clean(postgres_url_session):
     """Provide a clean PostgreSQL database for each test.
 
-    Uses the session-scoped container but cleans up all tables between tests
+    Uses the session-scoped database but cleans up all tables between tests
     to ensure test isolation.
     """
-    import psycopg
+    _drop_all_tables(postgres_url_session)
+    yield postgres_url_session
 
-    db_url = postgres_container_session.get_connection_url(driver=None)
 
-    # Drop all tables before test runs
-    conn = psycopg.connect(db_url)
-    try:
-        cursor = conn.cursor()
+def _postgres_may_be_available() -> bool:
+    """Check, without contacting anything, whether PostgreSQL tests could run.
 
-        # Get all table names in public schema
-        cursor.execute("""
-            SELECT tablename FROM pg_tables
-            WHERE schemaname = 'public'
-        """)
-        tables = cursor.fetchall()
+    True if POSTGRES_URL names a server, or if there is any sign of a Docker
+    daemon: DOCKER_HOST, or the usual rootful or rootless socket.
+    """
+    if os.environ.get("POSTGRES_URL") or os.environ.get("DOCKER_HOST"):
+        return True
+    sockets = ["/var/run/docker.sock"]
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        sockets.append(os.path.join(runtime_dir, "docker.sock"))
+    return any(os.path.exists(socket) for socket in sockets)
 
-        # Drop each table
-        for (table_name,) in tables:
-            cursor.execute(f'DROP TABLE IF EXISTS "{table_name}" CASCADE')
 
-        conn.commit()
-    finally:
-        conn.close()
+def pytest_generate_tests(metafunc):
+    """Parametrize db_url over the databases the tests can use.
 
-    yield db_url
+    Where there is clearly no PostgreSQL server or Docker daemon, only SQLite
+    variants are generated, so the Docker SDK is never imported or pinged.
+    """
+    if "db_url" in metafunc.fixturenames:
+        backends = ["sqlite", "postgres"] if _postgres_may_be_available() else ["sqlite"]
+        metafunc.parametrize("db_url", backends, indirect=True)
 
 
-@pytest.fixture(params=["sqlite", "postgres"])
+@pytest.fixture
 def db_url(request, tmp_path):
     """Provide database connection URL for both SQLite and PostgreSQL.
 
-    This is a parametrized fixture that runs tests with both databases.
-    For postgres, it uses the session-scoped container with per-test cleanup.
+    This fixture is parametrized by pytest_generate_tests to run tests with both
+    databases. For postgres, it uses the session-scoped database with per-test
+    cleanup.
     """
     if request.param == "sqlite":
         # SQLite: use file-based database
         db_file = tmp_path / "test.db"
         return f"sqlite:///{db_file}"
     else:
-        # PostgreSQL: get the session container and clean tables
+        # PostgreSQL: get the session database and clean tables
         skip, reason = should_skip_postgres_tests()
         if skip:
             pytest.skip(reason)
 
-        # Try to get the session-scoped container
+        # Try to get the session-scoped database
         # If it doesn't exist yet, pytest will create it
         try:
-            container = request.getfixturevalue("postgres_container_session")
+            db_url = request.getfixturevalue("postgres_url_session")
         except Exception:
             # If container setup fails, skip this test
             pytest.skip("PostgreSQL container not available")
 
-        import psycopg
-
-        db_url = container.get_connection_url(driver=None)
-
-        # Drop all tables before test runs
-        conn = psycopg.connect(db_url)
-        try:
-            cursor = conn.cursor()
-
-            # Get all table names in public schema
-            cursor.execute("""
-                SELECT tablename FROM pg_tables
-                WHERE schemaname = 'public'
-            """)
-            tables = cursor.fetchall()
-
-            # Drop each table
-            for (table_name,) in tables:
-                cursor.execute(f'DROP TABLE IF EXISTS "{table_name}" CASCADE')
-
-            conn.commit()
-        finally:
-            conn.close()
-
+        _drop_all_tables(db_url)
         return db_url
 
 
@@ -169,6 +308,6 @@ def sqlite_db(tmp_path):
 def postgres_db(postgres_db_clean):
     """Provide PostgreSQL database connection URL.
 
-    Uses the session-scoped container with per-test table cleanup.
+    Uses the session-scoped database with per-test table cleanup.
     """
     return postgres_db_clean
@@ -1,36 +1,116 @@
 """Shared database test utilities."""
 
+import atexit
 import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
+from psycopg_pool import ConnectionPool
 
-def _get_db_connection(db_url: str) -> tuple[Any, Any, bool]:
-    """Get database connection and cursor.
+_SQLITE_URL_PREFIX = "sqlite:///"
+
+# Open SQLite connections by database path, most recently used last
+_SQLITE_CONNECTIONS: dict[str, sqlite3.Connection] = {}
+_SQLITE_MAX_CONNECTIONS = 8
+
+# PostgreSQL connection pools by connection URL
+_PG_POOLS: dict[str, ConnectionPool] = {}
+
+
+@lru_cache(maxsize=128)
+def _parse_db_url(db_url: str) -> tuple[bool, str]:
+    """Parse a database URL once.
+
+    Returns:
+        Tuple of (is_sqlite, SQLite file path or the PostgreSQL URL)
+    """
+    if db_url.startswith(_SQLITE_URL_PREFIX):
+        return True, db_url[len(_SQLITE_URL_PREFIX) :]
+    return False, db_url
+
+
+def _sqlite_connection(db_path: str) -> sqlite3.Connection:
+    """Get a shared connection to a SQLite database file.
+
+    Tests often make several assertions against the same database, so the
+    connection is kept open between calls instead of reopening the file each
+    time. It is in autocommit mode, so it never holds a transaction (and its
+    locks) open between queries and always sees the latest committed data.
+    Only the most recently used few are kept, closing the rest.
+    """
+    conn = _SQLITE_CONNECTIONS.pop(db_path, None)
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        if len(_SQLITE_CONNECTIONS) >= _SQLITE_MAX_CONNECTIONS:
+            # Dicts keep insertion order, so the first entry is the least recent
+            _SQLITE_CONNECTIONS.pop(next(iter(_SQLITE_CONNECTIONS))).close()
+    _SQLITE_CONNECTIONS[db_path] = conn
+    return conn
+
+
+@atexit.register
+def _close_sqlite_connections() -> None:
+    """Close the shared SQLite connections."""
+    for conn in _SQLITE_CONNECTIONS.values():
+        conn.close()
+    _SQLITE_CONNECTIONS.clear()
+
+
+def _pg_pool(db_url: str) -> ConnectionPool:
+    """Get a connection pool for a PostgreSQL database.
+
+    Pooling saves a connection handshake per helper call. Connections are in
+    autocommit mode, so idle ones hold no locks that would block the tests'
+    own schema changes or the cleanup between tests.
+    """
+    pool = _PG_POOLS.get(db_url)
+    if pool is None:
+        pool = ConnectionPool(
+            db_url, min_size=1, max_size=8, kwargs={"autocommit": True}, open=True
+        )
+        _PG_POOLS[db_url] = pool
+    return pool
+
+
+@atexit.register
+def close_pg_pools() -> None:
+    """Close the PostgreSQL connection pools.
+
+    Runs automatically at interpreter exit. Call it sooner to release the
+    pools' connections, e.g. before dropping the database they connect to.
+    """
+    for pool in _PG_POOLS.values():
+        pool.close()
+    _PG_POOLS.clear()
+
+
+@contextmanager
+def _db_cursor(db_url: str) -> Iterator[tuple[Any, bool]]:
+    """Get a database cursor for the duration of a block.
 
     Args:
         db_url: Database connection URL
 
-    Returns:
-        Tuple of (connection, cursor, is_sqlite)
+    Yields:
+        Tuple of (cursor, is_sqlite)
     """
-    if db_url.startswith("sqlite"):
-        db_path = db_url.replace("sqlite:///", "")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        return conn, cursor, True
+    is_sqlite, target = _parse_db_url(db_url)
+    if is_sqlite:
+        cursor = _sqlite_connection(target).cursor()
+        try:
+            yield cursor, True
+        finally:
+            cursor.close()
     else:
-        import psycopg
-
-        conn = psycopg.connect(db_url)
-        cursor = conn.cursor()
-        return conn, cursor, False
+        with _pg_pool(target).connection() as conn, conn.cursor() as cursor:
+            yield cursor, False
 
 
 def execute_query(db_url: str, query: str, params: tuple = ()) -> list[tuple]:
     """Execute a query and return results for any database type."""
-    conn, cursor, is_sqlite = _get_db_connection(db_url)
-
-    try:
+    with _db_cursor(db_url) as (cursor, is_sqlite):
         # Replace %s with ? for SQLite
         if is_sqlite:
             query = query.replace("%s", "?")
@@ -38,20 +118,15 @@ def execute_query(db_url: str, query: str, params: tuple = ()) -> list[tuple]:
         cursor.execute(query, params)
         results = cursor.fetchall()
         return results
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_table_columns(db_url: str, table_name: str) -> list[str]:
     """Get column names from a table for any database type."""
-    conn, cursor, is_sqlite = _get_db_connection(db_url)
-
-    try:
+    with _db_cursor(db_url) as (cursor, is_sqlite):
         if is_sqlite:
-            cursor.execute(f'PRAGMA table_info("{table_name}")')
-            columns = [row[1] for row in cursor.fetchall()]  # Column name is at index 1
-            return sorted(columns)
+            # A parameterized query, unlike PRAGMA table_info, is parsed once and
+            # then reused from the connection's statement cache
+            cursor.execute("SELECT name FROM pragma_table_info(?) ORDER BY cid", (table_name,))
         else:
             cursor.execute(
                 """
@@ -62,17 +137,13 @@ def get_table_columns(db_url: str, table_name: str) -> list[str]:
                 """,
                 (table_name,),
             )
-            return [row[0] for row in cursor.fetchall()]
-    finally:
-        cursor.close()
-        conn.close()
+        # Both backends list columns in table order
+        return [row[0] for row in cursor.fetchall()]
 
 
 def table_exists(db_url: str, table_name: str) -> bool:
     """Check if a table exists in the database."""
-    conn, cursor, is_sqlite = _get_db_connection(db_url)
-
-    try:
+    with _db_cursor(db_url) as (cursor, is_sqlite):
         if is_sqlite:
             cursor.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
@@ -90,29 +161,17 @@ def table_exists(db_url: str, table_name: str) -> bool:
                 (table_name,),
             )
             return cursor.fetchone()[0]
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def get_table_indexes(db_url: str, table_name: str) -> set[str]:
     """Get index names from a table for any database type."""
-    if db_url.startswith("sqlite"):
-        db_path = db_url.replace("sqlite:///", "")
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=?", (table_name,)
-        )
-        indexes = {row[0].lower() for row in cursor.fetchall()}
-        cursor.close()
-        conn.close()
-        return indexes
-    else:
-        import psycopg
-
-        with psycopg.connect(db_url) as conn, conn.cursor() as cur:
-            cur.execute(
+    with _db_cursor(db_url) as (cursor, is_sqlite):
+        if is_sqlite:
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=?", (table_name,)
+            )
+        else:
+            cursor.execute(
                 """
                 SELECT indexname
                 FROM pg_indexes
@@ -120,4 +179,4 @@ def get_table_indexes(db_url: str, table_name: str) -> set[str]:
             """,
                 (table_name,),
             )
-            return {row[0].lower() for row in cur.fetchall()}
+        return {row[0].lower() for row in cursor.fetchall()}
@@ -6,11 +6,8 @@ import pytest
 
 from crump.config import CrumpConfig
 
-
-def test_get_job_or_auto_detect_single_job(tmp_path: Path) -> None:
-    """Test auto-detection when config has exactly one job."""
-    config_file = tmp_path / "crump_config.yaml"
-    config_file.write_text("""
+# Config with one job, shared by the tests that only need a single job
+_SINGLE_JOB_CONFIG = b"""
 jobs:
   my_job:
     target_table: test_table
@@ -18,7 +15,13 @@ jobs:
       id: db_id
     columns:
       name: db_name
-""")
+"""
+
+
+def test_get_job_or_auto_detect_single_job(tmp_path: Path) -> None:
+    """Test auto-detection when config has exactly one job."""
+    config_file = tmp_path / "crump_config.yaml"
+    config_file.write_bytes(_SINGLE_JOB_CONFIG)
 
     config = CrumpConfig.from_yaml(config_file)
 
@@ -33,15 +36,7 @@ jobs:
 def test_get_job_or_auto_detect_explicit_job_name(tmp_path: Path) -> None:
     """Test explicit job name works even with single job."""
     config_file = tmp_path / "crump_config.yaml"
-    config_file.write_text("""
-jobs:
-  my_job:
-    target_table: test_table
-    id_mapping:
-      id: db_id
-    columns:
-      name: db_name
-""")
+    config_file.write_bytes(_SINGLE_JOB_CONFIG)
 
     config = CrumpConfig.from_yaml(config_file)
 
@@ -89,15 +84,7 @@ jobs:
 def test_get_job_or_auto_detect_nonexistent_job(tmp_path: Path) -> None:
     """Test that nonexistent job returns None."""
     config_file = tmp_path / "crump_config.yaml"
-    config_file.write_text("""
-jobs:
-  my_job:
-    target_table: test_table
-    id_mapping:
-      id: db_id
-    columns:
-      name: db_name
-""")
+    config_file.write_bytes(_SINGLE_JOB_CONFIG)
 
     config = CrumpConfig.from_yaml(config_file)
 
@@ -7,26 +7,85 @@ from pathlib import Path
 
 import pytest
 
-from crump.cdf_extractor import extract_cdf_to_csv, extract_cdf_with_config
-from crump.cdf_reader import read_cdf_variables
+from crump.cdf_extractor import ExtractionResult, extract_cdf_to_csv, extract_cdf_with_config
+from crump.cdf_reader import CDFVariable, read_cdf_variables
 from crump.config import ColumnMapping, CrumpJob
 
+# Keep these tests on one worker under pytest -n, so the session-scoped CDF
+# reads and extractions below are shared rather than repeated on every worker
+pytestmark = pytest.mark.xdist_group("cdf_extract")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def solo_cdf_file() -> Path:
     """Path to Solar Orbiter CDF test file."""
     return Path("tests/data/solo_L2_mag-rtn-normal-1-minute-internal_20241225_V00.cdf")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def imap_cdf_file() -> Path:
     """Path to IMAP CDF test file."""
     return Path("tests/data/imap_mag_l1c_norm-magi_20251010_v001.cdf")
 
 
-def test_read_cdf_variables_solo(solo_cdf_file: Path) -> None:
+@pytest.fixture(scope="session")
+def solo_variables(solo_cdf_file: Path) -> list[CDFVariable]:
+    """Variables of the Solar Orbiter CDF test file, read once per session."""
+    return read_cdf_variables(solo_cdf_file)
+
+
+def _extract_once(
+    cdf_file: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    automerge: bool,
+    variable_names: list[str] | None = None,
+) -> list[ExtractionResult]:
+    """Extract a CDF file into a fresh session directory with the default template."""
+    return extract_cdf_to_csv(
+        cdf_file_path=cdf_file,
+        output_dir=tmp_path_factory.mktemp("cdf_extract"),
+        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
+        automerge=automerge,
+        append=False,
+        variable_names=variable_names,
+    )
+
+
+# Extractions shared by the tests that only inspect their results, so each CDF
+# file is read and written out once per session. Tests that append to, collide
+# with or otherwise depend on fresh output extract for themselves.
+@pytest.fixture(scope="session")
+def solo_separate_extract(
+    solo_cdf_file: Path, tmp_path_factory: pytest.TempPathFactory
+) -> list[ExtractionResult]:
+    """Solar Orbiter file extracted with one CSV per variable."""
+    return _extract_once(solo_cdf_file, tmp_path_factory, automerge=False)
+
+
+@pytest.fixture(scope="session")
+def solo_merged_extract(
+    solo_cdf_file: Path, tmp_path_factory: pytest.TempPathFactory
+) -> list[ExtractionResult]:
+    """Solar Orbiter file extracted with variables merged by record count."""
+    return _extract_once(solo_cdf_file, tmp_path_factory, automerge=True)
+
+
+@pytest.fixture(scope="session")
+def imap_vectors_merged_extract(
+    imap_cdf_file: Path, tmp_path_factory: pytest.TempPathFactory
+) -> list[ExtractionResult]:
+    """IMAP vectors, epoch and vector_magnitude extracted with automerge."""
+    return _extract_once(
+        imap_cdf_file,
+        tmp_path_factory,
+        automerge=True,
+        variable_names=["vectors", "epoch", "vector_magnitude"],
+    )
+
+
+def test_read_cdf_variables_solo(solo_variables: list[CDFVariable]) -> None:
     """Test reading variables from Solar Orbiter CDF file."""
-    variables = read_cdf_variables(solo_cdf_file)
+    variables = solo_variables
 
     assert len(variables) > 0
 
@@ -53,16 +112,9 @@ def test_read_cdf_variables_imap(imap_cdf_file: Path) -> None:
     assert "vector_magnitude" in var_names
 
 
-def test_extract_with_automerge(solo_cdf_file: Path, tmp_path: Path) -> None:
+def test_extract_with_automerge(solo_merged_extract: list[ExtractionResult]) -> None:
     """Test extracting CDF with automerge enabled."""
-    results = extract_cdf_to_csv(
-        cdf_file_path=solo_cdf_file,
-        output_dir=tmp_path,
-        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
-        automerge=True,
-        append=False,
-        variable_names=None,
-    )
+    results = solo_merged_extract
 
     # Should create merged CSV files
     assert len(results) > 0
@@ -76,21 +128,13 @@ def test_extract_with_automerge(solo_cdf_file: Path, tmp_path: Path) -> None:
         # Verify CSV is readable
         with open(result.output_file, encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            rows = list(reader)
-            assert len(rows) == result.num_rows
+            assert sum(1 for _ in reader) == result.num_rows
             assert len(reader.fieldnames or []) == result.num_columns
 
 
-def test_extract_without_automerge(solo_cdf_file: Path, tmp_path: Path) -> None:
+def test_extract_without_automerge(solo_separate_extract: list[ExtractionResult]) -> None:
     """Test extracting CDF with automerge disabled."""
-    results = extract_cdf_to_csv(
-        cdf_file_path=solo_cdf_file,
-        output_dir=tmp_path,
-        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
-        automerge=False,
-        append=False,
-        variable_names=None,
-    )
+    results = solo_separate_extract
 
     # Should create separate CSV for each variable
     assert len(results) > 0
@@ -134,19 +178,33 @@ def test_extract_nonexistent_variable(solo_cdf_file: Path, tmp_path: Path) -> No
         )
 
 
-def test_extract_with_custom_filename_template(solo_cdf_file: Path, tmp_path: Path) -> None:
-    """Test extraction with custom filename template."""
+@pytest.mark.parametrize(
+    ("filename_template", "expected_name"),
+    [
+        ("data_[VARIABLE_NAME].csv", "data_EPOCH.csv"),
+        ("[VARIABLE_NAME].csv", "EPOCH.csv"),
+        ("[SOURCE_FILE].csv", "solo_L2_mag-rtn-normal-1-minute-internal_20241225_V00.csv"),
+        (
+            "[SOURCE_FILE]_[VARIABLE_NAME].csv",
+            "solo_L2_mag-rtn-normal-1-minute-internal_20241225_V00_EPOCH.csv",
+        ),
+    ],
+)
+def test_extract_with_custom_filename_template(
+    solo_cdf_file: Path, tmp_path: Path, filename_template: str, expected_name: str
+) -> None:
+    """Test extraction with custom filename templates."""
     results = extract_cdf_to_csv(
         cdf_file_path=solo_cdf_file,
         output_dir=tmp_path,
-        filename_template="data_[VARIABLE_NAME].csv",
+        filename_template=filename_template,
         automerge=False,
         append=False,
         variable_names=["EPOCH"],
     )
 
     assert len(results) == 1
-    assert results[0].output_file.name == "data_EPOCH.csv"
+    assert results[0].output_file.name == expected_name
 
 
 def test_extract_with_append_mode(solo_cdf_file: Path, tmp_path: Path) -> None:
@@ -178,9 +236,8 @@ def test_extract_with_append_mode(solo_cdf_file: Path, tmp_path: Path) -> None:
     # File should now have double the rows (header is not duplicated)
     with open(output_file, encoding="utf-8") as f:
         reader = csv.reader(f)
-        rows = list(reader)
         # First row is header, rest are data
-        assert len(rows) == original_rows * 2 + 1  # 1 header + 2x data
+        assert sum(1 for _ in reader) == original_rows * 2 + 1  # 1 header + 2x data
 
 
 def test_extract_file_exists_error(solo_cdf_file: Path, tmp_path: Path) -> None:
@@ -228,16 +285,11 @@ def test_extract_append_header_mismatch(solo_cdf_file: Path, tmp_path: Path) ->
         )
 
 
-def test_extract_filename_uses_first_variable(imap_cdf_file: Path, tmp_path: Path) -> None:
+def test_extract_filename_uses_first_variable(
+    imap_vectors_merged_extract: list[ExtractionResult],
+) -> None:
     """Test that merged CSV files use the first variable name in filename."""
-    results = extract_cdf_to_csv(
-        cdf_file_path=imap_cdf_file,
-        output_dir=tmp_path,
-        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
-        automerge=True,
-        append=False,
-        variable_names=["vectors", "epoch", "vector_magnitude"],
-    )
+    results = imap_vectors_merged_extract
 
     # All three variables have the same record count, should be merged
     assert len(results) == 1
@@ -315,16 +367,11 @@ def test_extract_creates_output_directory(solo_cdf_file: Path, tmp_path: Path) -
     assert len(results) > 0
 
 
-def test_extract_merges_same_record_count_variables(imap_cdf_file: Path, tmp_path: Path) -> None:
+def test_extract_merges_same_record_count_variables(
+    imap_vectors_merged_extract: list[ExtractionResult],
+) -> None:
     """Test that variables with the same record count are merged when automerge is True."""
-    results = extract_cdf_to_csv(
-        cdf_file_path=imap_cdf_file,
-        output_dir=tmp_path,
-        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
-        automerge=True,
-        append=False,
-        variable_names=["vectors", "epoch", "vector_magnitude"],
-    )
+    results = imap_vectors_merged_extract
 
     # All three variables should have the same record count and be merged
     assert len(results) == 1
@@ -337,9 +384,11 @@ def test_extract_merges_same_record_count_variables(imap_cdf_file: Path, tmp_pat
     assert result.num_columns == 6
 
 
-def test_cdf_variable_column_names_with_labels(solo_cdf_file: Path) -> None:
+def test_cdf_variable_column_names_with_labels(
+    solo_cdf_file: Path, solo_variables: list[CDFVariable]
+) -> None:
     """Test that CDF variables use label metadata for column names when available."""
-    variables = read_cdf_variables(solo_cdf_file)
+    variables = solo_variables
 
     # Find B_RTN variable which has labels
     b_rtn_var = next((v for v in variables if v.name == "B_RTN"), None)
@@ -355,16 +404,9 @@ def test_cdf_variable_column_names_with_labels(solo_cdf_file: Path) -> None:
     assert "B_r" in col_names[0] or "B_t" in col_names[1] or "B_n" in col_names[2]
 
 
-def test_unique_column_names(solo_cdf_file: Path, tmp_path: Path) -> None:
+def test_unique_column_names(solo_merged_extract: list[ExtractionResult]) -> None:
     """Test that all column names in extracted CSV are unique."""
-    results = extract_cdf_to_csv(
-        cdf_file_path=solo_cdf_file,
-        output_dir=tmp_path,
-        filename_template="[SOURCE_FILE]-[VARIABLE_NAME].csv",
-        automerge=True,
-        append=False,
-        variable_names=None,
-    )
+    results = solo_merged_extract
 
     for result in results:
         # Check that all column names are unique
@@ -394,9 +436,8 @@ def test_extract_with_max_records(solo_cdf_file: Path, tmp_path: Path) -> None:
     # Verify actual file has correct number of rows
     with open(result.output_file, encoding="utf-8") as f:
         reader = csv.reader(f)
-        rows = list(reader)
         # 1 header + max_records data rows
-        assert len(rows) == max_records + 1
+        assert sum(1 for _ in reader) == max_records + 1
 
 
 def test_extract_max_records_larger_than_available(solo_cdf_file: Path, tmp_path: Path) -> None:
@@ -444,8 +485,7 @@ def test_extract_max_records_with_automerge(imap_cdf_file: Path, tmp_path: Path)
     # Verify the CSV file
     with open(result.output_file, encoding="utf-8") as f:
         reader = csv.reader(f)
-        rows = list(reader)
-        assert len(rows) == max_records + 1  # 1 header + max_records data
+        assert sum(1 for _ in reader) == max_records + 1  # 1 header + max_records data
 
 
 def test_extract_max_records_none_extracts_all(solo_cdf_file: Path, tmp_path: Path) -> None:
@@ -503,8 +543,7 @@ def test_extract_cdf_with_config_basic(imap_cdf_file: Path, tmp_path: Path) -> N
         headers = reader.fieldnames
         assert headers == ["id", "vector_x", "vector_y", "magnitude"]
 
-        rows = list(reader)
-        assert len(rows) == result.num_rows
+        assert sum(1 for _ in reader) == result.num_rows
 
 
 def test_extract_cdf_with_config_column_renaming(imap_cdf_file: Path, tmp_path: Path) -> None:
@@ -568,8 +607,7 @@ def test_extract_cdf_with_config_max_records(solo_cdf_file: Path, tmp_path: Path
     # Verify file
     with open(result.output_file, encoding="utf-8") as f:
         reader = csv.reader(f)
-        rows = list(reader)
-        assert len(rows) == max_records + 1  # 1 header + max_records data
+        assert sum(1 for _ in reader) == max_records + 1  # 1 header + max_records data
 
 
 def test_extract_cdf_with_config_missing_column(imap_cdf_file: Path, tmp_path: Path) -> None:
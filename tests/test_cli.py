@@ -1,35 +1,81 @@
 """Tests for CLI commands."""
 
+from collections.abc import Callable
 from pathlib import Path
 
-from click.testing import CliRunner
+import click
+import pytest
+from click.testing import CliRunner, Result
 
 from crump import __version__
 from crump.cli import main
+from crump.cli_prepare import suggest_indexes
+from tests.db_test_utils import execute_query
+from tests.test_helpers import create_config_file, create_csv_file
+
+# Keep the module on one xdist worker, so the module fixtures are built once
+pytestmark = pytest.mark.xdist_group("cli")
+
+
+@pytest.fixture(scope="module")
+def sync_corpus(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a directory of input files shared by sync tests that only read them.
+
+    Contains an empty CSV, a small valid CSV, and configs for jobs named
+    'test' and 'real_job'.
+    """
+    corpus = tmp_path_factory.mktemp("sync")
+    (corpus / "empty.csv").touch()
+    create_csv_file(corpus / "valid.csv", ["id", "value"], [{"id": "1", "value": "test"}])
+    create_config_file(corpus / "test.yaml", "test", "test", {"id": "id"})
+    create_config_file(corpus / "real_job.yaml", "real_job", "test", {"id": "id"})
+    return corpus
+
+
+@pytest.fixture(scope="module")
+def sync_command() -> click.Command:
+    """Provide the sync command, for checking its options without rendering help.
+
+    The rendered help is covered once by test_sync_help.
+    """
+    command = main.get_command(click.Context(main), "sync")
+    assert command is not None
+    return command
+
+
+@pytest.fixture(scope="module")
+def dry_run_db_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide a SQLite database file path shared by dry-run tests.
+
+    A dry run must leave the database untouched, so tests that only dry-run can
+    share it. Tests that write to the database use their own under tmp_path.
+    """
+    return tmp_path_factory.mktemp("dry_run") / "test.db"
 
 
 class TestCLIBasics:
     """Test suite for basic CLI functionality."""
 
-    def test_main_group_help(self, cli_runner: CliRunner) -> None:
-        """Test main command group shows help."""
-        result = cli_runner.invoke(main, ["--help"])
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [(["--help"], "Sync CSV and CDF"), (["--version"], __version__)],
+        ids=["help", "version"],
+    )
+    def test_main_group_option(
+        self, invoke_cached: Callable[..., Result], args: list[str], expected: str
+    ) -> None:
+        """Test main command group --help and --version output."""
+        result = invoke_cached(*args)
         assert result.exit_code == 0
-        assert "Sync CSV and CDF" in result.output
-
-    def test_version_option(self, cli_runner: CliRunner) -> None:
-        """Test --version flag displays version."""
-        result = cli_runner.invoke(main, ["--version"])
-        assert result.exit_code == 0
-        assert __version__ in result.output
+        assert expected in result.output
 
 
 class TestSyncCommand:
     """Test suite for sync command."""
 
-    def test_sync_help(self, cli_runner: CliRunner) -> None:
+    def test_sync_help(self, invoke_cached: Callable[..., Result]) -> None:
         """Test sync command help."""
-        result = cli_runner.invoke(main, ["sync", "--help"])
+        result = invoke_cached("sync", "--help")
         assert result.exit_code == 0
         assert "Sync a CSV" in result.output
         assert "FILE_PATH" in result.output
@@ -42,42 +88,21 @@ class TestSyncCommand:
         assert result.exit_code != 0
         assert "Missing argument" in result.output
 
-    def test_sync_nonexistent_file(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        """Test sync with nonexistent CSV file fails."""
-        from tests.test_helpers import create_config_file
-
-        config_file = tmp_path / "crump_config.yaml"
-        create_config_file(config_file, "test", "test", {"id": "id"})
-
-        nonexistent = tmp_path / "doesnotexist.csv"
-
-        result = cli_runner.invoke(
-            main,
-            [
-                "sync",
-                str(nonexistent),
-                str(config_file),
-                "--job",
-                "test",
-                "--db-url",
-                "postgresql://localhost/test",
-            ],
-        )
-        assert result.exit_code != 0
-
-    def test_sync_nonexistent_config(self, cli_runner: CliRunner, tmp_path: Path) -> None:
-        """Test sync with nonexistent config file fails."""
-        csv_file = tmp_path / "test.csv"
-        csv_file.touch()
-
-        nonexistent_config = tmp_path / "nonexistent.yaml"
-
+    @pytest.mark.parametrize(
+        ("csv_name", "config_name"),
+        [("doesnotexist.csv", "test.yaml"), ("empty.csv", "nonexistent.yaml")],
+        ids=["csv", "config"],
+    )
+    def test_sync_nonexistent_path(
+        self, cli_runner: CliRunner, sync_corpus: Path, csv_name: str, config_name: str
+    ) -> None:
+        """Test sync with a nonexistent CSV or config file fails."""
         result = cli_runner.invoke(
             main,
             [
                 "sync",
-                str(csv_file),
-                str(nonexistent_config),
+                str(sync_corpus / csv_name),
+                str(sync_corpus / config_name),
                 "--job",
                 "test",
                 "--db-url",
@@ -86,22 +111,14 @@ class TestSyncCommand:
         )
         assert result.exit_code != 0
 
-    def test_sync_invalid_job_name(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_sync_invalid_job_name(self, cli_runner: CliRunner, sync_corpus: Path) -> None:
         """Test sync with invalid job name fails gracefully."""
-        from tests.test_helpers import create_config_file, create_csv_file
-
-        csv_file = tmp_path / "test.csv"
-        create_csv_file(csv_file, ["id", "value"], [{"id": "1", "value": "test"}])
-
-        config_file = tmp_path / "crump_config.yaml"
-        create_config_file(config_file, "real_job", "test", {"id": "id"})
-
         result = cli_runner.invoke(
             main,
             [
                 "sync",
-                str(csv_file),
-                str(config_file),
+                str(sync_corpus / "valid.csv"),
+                str(sync_corpus / "real_job.yaml"),
                 "--job",
                 "nonexistent_job",
                 "--db-url",
@@ -112,17 +129,11 @@ class TestSyncCommand:
         assert "Job 'nonexistent_job' not found" in result.output
         assert "Available jobs: real_job" in result.output
 
-    def test_sync_missing_database_url(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_sync_missing_database_url(self, cli_runner: CliRunner, sync_corpus: Path) -> None:
         """Test sync without database URL fails."""
-        from tests.test_helpers import create_config_file
-
-        csv_file = tmp_path / "test.csv"
-        csv_file.touch()
-
-        config_file = tmp_path / "crump_config.yaml"
-        create_config_file(config_file, "test", "test", {"id": "id"})
-
-        result = cli_runner.invoke(main, ["sync", str(csv_file), str(config_file), "test"])
+        result = cli_runner.invoke(
+            main, ["sync", str(sync_corpus / "empty.csv"), str(sync_corpus / "test.yaml"), "test"]
+        )
         assert result.exit_code != 0
         assert "Missing option" in result.output or "required" in result.output.lower()
 
@@ -130,134 +141,109 @@ class TestSyncCommand:
 class TestSuggestIndexes:
     """Test suite for index suggestion functionality."""
 
-    def test_suggest_indexes_for_date_columns(self) -> None:
-        """Test that date columns get descending indexes."""
-        from crump.cli_prepare import suggest_indexes
-
-        columns = {
-            "id": ("integer", False),
-            "created_date": ("date", False),
-            "updated_at": ("datetime", True),
-            "name": ("text", True),
-        }
-
-        indexes = suggest_indexes(columns, "id")
-
-        # Should have 2 indexes (for date and datetime columns)
-        assert len(indexes) == 2
-
-        # Find the indexes by name
-        created_idx = next(idx for idx in indexes if idx.name == "idx_created_date")
-        updated_idx = next(idx for idx in indexes if idx.name == "idx_updated_at")
-
-        # Both should be descending
-        assert created_idx.columns[0].column == "created_date"
-        assert created_idx.columns[0].order == "DESC"
-        assert updated_idx.columns[0].column == "updated_at"
-        assert updated_idx.columns[0].order == "DESC"
-
-    def test_suggest_indexes_for_id_key_columns(self) -> None:
-        """Test that columns ending in _id or _key get ascending indexes."""
-        from crump.cli_prepare import suggest_indexes
-
-        columns = {
-            "id": ("integer", False),
-            "user_id": ("integer", False),
-            "account_key": ("text", True),
-            "name": ("text", False),
-        }
-
-        indexes = suggest_indexes(columns, "id")
-
-        # Should have 2 indexes (for user_id and account_key)
-        assert len(indexes) == 2
-
-        # Find the indexes by name
-        user_idx = next(idx for idx in indexes if idx.name == "idx_user_id")
-        account_idx = next(idx for idx in indexes if idx.name == "idx_account_key")
-
-        # Both should be ascending
-        assert user_idx.columns[0].column == "user_id"
-        assert user_idx.columns[0].order == "ASC"
-        assert account_idx.columns[0].column == "account_key"
-        assert account_idx.columns[0].order == "ASC"
-
-    def test_suggest_indexes_excludes_id_column(self) -> None:
-        """Test that the ID column doesn't get an index."""
-        from crump.cli_prepare import suggest_indexes
-
-        columns = {
-            "user_id": ("integer", False),
-            "created_at": ("datetime", False),
-        }
-
-        indexes = suggest_indexes(columns, "user_id")
-
-        # Should only have index for created_at, not user_id
-        assert len(indexes) == 1
-        assert indexes[0].name == "idx_created_at"
-
-    def test_suggest_indexes_mixed_columns(self) -> None:
-        """Test index suggestion with mixed column types."""
-        from crump.cli_prepare import suggest_indexes
-
-        columns = {
-            "order_id": ("integer", False),
-            "customer_id": ("integer", False),
-            "product_key": ("text", True),
-            "order_date": ("date", False),
-            "delivery_date": ("datetime", True),
-            "total_amount": ("float", False),
-            "notes": ("text", True),
-        }
-
-        indexes = suggest_indexes(columns, "order_id")
-
-        # Should have 4 indexes: customer_id, product_key, order_date, delivery_date
-        assert len(indexes) == 4
-
-        index_names = {idx.name for idx in indexes}
-        assert "idx_customer_id" in index_names
-        assert "idx_product_key" in index_names
-        assert "idx_order_date" in index_names
-        assert "idx_delivery_date" in index_names
-
-        # Check orders
-        for idx in indexes:
-            if idx.name in ["idx_order_date", "idx_delivery_date"]:
-                assert idx.columns[0].order == "DESC"
-            else:
-                assert idx.columns[0].order == "ASC"
-
-    def test_suggest_indexes_no_indexable_columns(self) -> None:
-        """Test with no columns that should be indexed."""
-        from crump.cli_prepare import suggest_indexes
-
-        columns = {
-            "id": ("integer", False),
-            "name": ("text", True),
-            "description": ("text", True),
-        }
-
-        indexes = suggest_indexes(columns, "id")
-
-        assert len(indexes) == 0
+    @pytest.mark.parametrize(
+        ("columns", "id_column", "expected"),
+        [
+            pytest.param(
+                {
+                    "id": ("integer", False),
+                    "created_date": ("date", False),
+                    "updated_at": ("datetime", True),
+                    "name": ("text", True),
+                },
+                "id",
+                {
+                    "idx_created_date": ("created_date", "DESC"),
+                    "idx_updated_at": ("updated_at", "DESC"),
+                },
+                id="date_columns_descending",
+            ),
+            pytest.param(
+                {
+                    "id": ("integer", False),
+                    "user_id": ("integer", False),
+                    "account_key": ("text", True),
+                    "name": ("text", False),
+                },
+                "id",
+                {
+                    "idx_user_id": ("user_id", "ASC"),
+                    "idx_account_key": ("account_key", "ASC"),
+                },
+                id="id_key_columns_ascending",
+            ),
+            pytest.param(
+                {
+                    "user_id": ("integer", False),
+                    "created_at": ("datetime", False),
+                },
+                "user_id",
+                {"idx_created_at": ("created_at", "DESC")},
+                id="excludes_id_column",
+            ),
+            pytest.param(
+                {
+                    "order_id": ("integer", False),
+                    "customer_id": ("integer", False),
+                    "product_key": ("text", True),
+                    "order_date": ("date", False),
+                    "delivery_date": ("datetime", True),
+                    "total_amount": ("float", False),
+                    "notes": ("text", True),
+                },
+                "order_id",
+                {
+                    "idx_customer_id": ("customer_id", "ASC"),
+                    "idx_product_key": ("product_key", "ASC"),
+                    "idx_order_date": ("order_date", "DESC"),
+                    "idx_delivery_date": ("delivery_date", "DESC"),
+                },
+                id="mixed_columns",
+            ),
+            pytest.param(
+                {
+                    "id": ("integer", False),
+                    "name": ("text", True),
+                    "description": ("text", True),
+                },
+                "id",
+                {},
+                id="no_indexable_columns",
+            ),
+        ],
+    )
+    def test_suggest_indexes(
+        self,
+        columns: dict[str, tuple[str, bool]],
+        id_column: str,
+        expected: dict[str, tuple[str, str]],
+    ) -> None:
+        """Test which single-column indexes are suggested, and their order."""
+        indexes = suggest_indexes(columns, id_column)
+
+        assert len(indexes) == len(expected)
+        assert {
+            idx.name: (idx.columns[0].column, idx.columns[0].order) for idx in indexes
+        } == expected
 
 
 class TestDryRunCommand:
     """Test suite for dry-run functionality."""
 
-    def test_sync_help_includes_dry_run(self, cli_runner: CliRunner) -> None:
-        """Test that sync command help includes --dry-run option."""
-        result = cli_runner.invoke(main, ["sync", "--help"])
-        assert result.exit_code == 0
-        assert "--dry-run" in result.output
-        assert "Simulate the sync without making" in result.output
-
-    def test_sync_dry_run_flag_with_sqlite(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+    def test_sync_has_dry_run_option(self, sync_command: click.Command) -> None:
+        """Test that the sync command has a documented --dry-run flag."""
+        options = {param.name: param for param in sync_command.params}
+        dry_run = options["dry_run"]
+        assert isinstance(dry_run, click.Option)
+        assert dry_run.opts == ["--dry-run"]
+        assert dry_run.is_flag
+        assert dry_run.help is not None
+        assert "Simulate the sync without making" in dry_run.help
+
+    def test_sync_dry_run_flag_with_sqlite(
+        self, cli_runner: CliRunner, tmp_path: Path, dry_run_db_file: Path
+    ) -> None:
         """Test sync with --dry-run flag using SQLite."""
-        from tests.test_helpers import create_config_file, create_csv_file
-
         # Create a simple CSV file
         csv_file = tmp_path / "test.csv"
         create_csv_file(
@@ -274,7 +260,7 @@ class TestDryRunCommand:
         create_config_file(config_file, "test_job", "test_table", {"id": "id"})
 
         # Create an SQLite database URL
-        db_file = tmp_path / "test.db"
+        db_file = dry_run_db_file
         db_url = f"sqlite:///{db_file}"
 
         # Run sync with dry-run flag
@@ -301,15 +287,11 @@ class TestDryRunCommand:
 
         # Verify no tables were created (connection may exist for SQLite)
         if db_file.exists():
-            from tests.db_test_utils import execute_query
-
             tables = execute_query(db_url, "SELECT name FROM sqlite_master WHERE type='table'")
             assert len(tables) == 0, "No tables should have been created during dry-run"
 
     def test_sync_without_dry_run_creates_data(self, cli_runner: CliRunner, tmp_path: Path) -> None:
         """Test that regular sync (without --dry-run) creates data."""
-        from tests.test_helpers import create_config_file, create_csv_file
-
         # Create a simple CSV file
         csv_file = tmp_path / "test.csv"
         create_csv_file(csv_file, ["id", "name"], [{"id": "1", "name": "Alice"}])
@@ -343,7 +325,5 @@ class TestDryRunCommand:
         # Verify database was created and contains data
         assert db_file.exists()
 
-        from tests.db_test_utils import execute_query
-
         count = execute_query(db_url, "SELECT COUNT(*) FROM test_table")
         assert count[0][0] == 1
@@ -1,19 +1,19 @@
 """Tests for config module."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
-from crump.config import CrumpConfig
+from crump.config import ColumnMapping, CrumpConfig, CrumpJob
 
 
 class TestConfigParsing:
     """Test suite for config file parsing."""
 
-    def test_load_valid_config(self, tmp_path: Path) -> None:
+    def test_load_valid_config(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading a valid configuration file."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -24,7 +24,6 @@ jobs:
       email: email
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         assert len(config.jobs) == 1
         assert "test_job" in config.jobs
 
@@ -37,10 +36,9 @@ jobs:
         assert job.id_mapping[0].db_column == "id"
         assert len(job.columns) == 2
 
-    def test_config_with_no_columns(self, tmp_path: Path) -> None:
+    def test_config_with_no_columns(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test config where no specific columns are listed (sync all)."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   sync_all:
     target_table: products
@@ -48,7 +46,6 @@ jobs:
       product_id: id
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("sync_all")
         assert job is not None
         assert job.columns == []
@@ -93,10 +90,20 @@ jobs:
         with pytest.raises(ValueError, match="missing 'id_mapping'"):
             CrumpConfig.from_yaml(config_file)
 
-    def test_get_nonexistent_job(self, tmp_path: Path) -> None:
-        """Test getting a job that doesn't exist."""
+    def test_config_job_not_a_mapping(self, tmp_path: Path) -> None:
+        """Test error when a job has no settings under its name."""
         config_file = tmp_path / "crump_config.yaml"
         config_file.write_text("""
+jobs:
+  bad_job:
+""")
+
+        with pytest.raises(ValueError, match="Job 'bad_job' must be a dictionary"):
+            CrumpConfig.from_yaml(config_file)
+
+    def test_get_nonexistent_job(self, load_config: Callable[[str], CrumpConfig]) -> None:
+        """Test getting a job that doesn't exist."""
+        config = load_config("""
 jobs:
   job1:
     target_table: table1
@@ -104,18 +111,78 @@ jobs:
       id: id
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("nonexistent")
         assert job is None
 
+    def test_names_shared_across_jobs(self, load_config: Callable[[str], CrumpConfig]) -> None:
+        """Test that a name used by several jobs is held as one string object."""
+        config = load_config("""
+jobs:
+  job1:
+    target_table: events
+    id_mapping:
+      event_id: id
+  job2:
+    target_table: events
+    id_mapping:
+      event_id: id
+""")
+
+        job1, job2 = config.jobs["job1"], config.jobs["job2"]
+        assert job1.target_table is job2.target_table
+        assert job1.id_mapping[0].csv_column is job2.id_mapping[0].csv_column
+        assert job1.id_mapping[0].db_column is job2.id_mapping[0].db_column
+
+    def test_reload_unchanged_config_is_independent(self, tmp_path: Path) -> None:
+        """Test that loading the same file twice gives configs that share no state."""
+        config_file = tmp_path / "crump_config.yaml"
+        config_file.write_text("""
+id_column_matchers:
+  - id
+jobs:
+  job1:
+    target_table: table1
+    id_mapping:
+      id: id
+""")
+
+        first = CrumpConfig.from_yaml(config_file)
+        assert first.id_column_matchers is not None
+        first.id_column_matchers.append("uuid")
+        first.jobs.clear()
+
+        second = CrumpConfig.from_yaml(config_file)
+        assert second.id_column_matchers == ["id"]
+        assert list(second.jobs) == ["job1"]
+
+    def test_reload_edited_config(self, tmp_path: Path) -> None:
+        """Test that loading a file again picks up changes made since."""
+        config_file = tmp_path / "crump_config.yaml"
+        config_file.write_text("""
+jobs:
+  job1:
+    target_table: table1
+    id_mapping:
+      id: id
+""")
+        assert CrumpConfig.from_yaml(config_file).jobs["job1"].target_table == "table1"
+
+        config_file.write_text("""
+jobs:
+  job1:
+    target_table: renamed_table
+    id_mapping:
+      id: id
+""")
+        assert CrumpConfig.from_yaml(config_file).jobs["job1"].target_table == "renamed_table"
+
 
 class TestColumnDataTypes:
     """Test suite for column data types in config."""
 
-    def test_config_with_data_types(self, tmp_path: Path) -> None:
+    def test_config_with_data_types(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test config with explicit data types."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   typed_job:
     target_table: users
@@ -137,7 +204,6 @@ jobs:
         type: text
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("typed_job")
 
         assert job is not None
@@ -146,30 +212,54 @@ jobs:
         assert len(job.columns) == 5
 
         # Check that data types are preserved
-        name_col = next(c for c in job.columns if c.csv_column == "name")
+        name_col = job.get_column("name")
         assert name_col.db_column == "full_name"
         assert name_col.data_type is None  # Simple format, no type
 
-        age_col = next(c for c in job.columns if c.csv_column == "age")
+        age_col = job.get_column("age")
         assert age_col.db_column == "user_age"
         assert age_col.data_type == "integer"
 
-        salary_col = next(c for c in job.columns if c.csv_column == "salary")
+        salary_col = job.get_column("salary")
         assert salary_col.db_column == "monthly_salary"
         assert salary_col.data_type == "float"
 
-        date_col = next(c for c in job.columns if c.csv_column == "birth_date")
+        date_col = job.get_column("birth_date")
         assert date_col.db_column == "dob"
         assert date_col.data_type == "date"
 
-        bio_col = next(c for c in job.columns if c.csv_column == "bio")
+        bio_col = job.get_column("bio")
         assert bio_col.db_column == "biography"
         assert bio_col.data_type == "text"
 
-    def test_extended_format_without_type(self, tmp_path: Path) -> None:
+    def test_get_column(self) -> None:
+        """Test looking up column mappings by CSV column name."""
+        job = CrumpJob(
+            name="test_job",
+            target_table="users",
+            id_mapping=[ColumnMapping("user_id", "id")],
+            columns=[
+                ColumnMapping("name", "full_name"),
+                ColumnMapping("name", "display_name"),
+                ColumnMapping(None, "total", expression="a + b", input_columns=["a", "b"]),
+            ],
+        )
+
+        name_col = job.get_column("name")
+        assert name_col is not None
+        assert name_col.db_column == "full_name"  # First mapping wins
+        assert job.get_column("missing") is None
+
+        # Replacing the list is picked up
+        job.columns = [ColumnMapping("email", "email_address")]
+        assert job.get_column("name") is None
+        email_col = job.get_column("email")
+        assert email_col is not None
+        assert email_col.db_column == "email_address"
+
+    def test_extended_format_without_type(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test extended format with db_column but no type."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -180,7 +270,6 @@ jobs:
         db_column: full_name
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
 
         assert job is not None
@@ -212,10 +301,11 @@ jobs:
 class TestIdColumnMatchers:
     """Test suite for id_column_matchers configuration."""
 
-    def test_config_with_id_column_matchers(self, tmp_path: Path) -> None:
+    def test_config_with_id_column_matchers(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with id_column_matchers."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 id_column_matchers:
   - customer_id
   - account_id
@@ -229,15 +319,14 @@ jobs:
       name: full_name
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
-
         assert config.id_column_matchers is not None
         assert config.id_column_matchers == ["customer_id", "account_id", "user_id"]
 
-    def test_config_without_id_column_matchers(self, tmp_path: Path) -> None:
+    def test_config_without_id_column_matchers(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config without id_column_matchers (uses defaults)."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -247,8 +336,6 @@ jobs:
       name: full_name
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
-
         assert config.id_column_matchers is None
 
     def test_config_invalid_id_column_matchers(self, tmp_path: Path) -> None:
@@ -290,10 +377,11 @@ jobs:
 class TestCompoundPrimaryKeys:
     """Test suite for compound primary keys."""
 
-    def test_config_with_compound_primary_key(self, tmp_path: Path) -> None:
+    def test_config_with_compound_primary_key(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with compound primary key."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: user_logins
@@ -304,7 +392,6 @@ jobs:
       ip_address: ip
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.id_mapping) == 2
@@ -343,10 +430,11 @@ jobs:
 class TestIndexes:
     """Test suite for database indexes."""
 
-    def test_config_with_single_column_index(self, tmp_path: Path) -> None:
+    def test_config_with_single_column_index(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with single-column index."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -361,7 +449,6 @@ jobs:
             order: ASC
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.indexes) == 1
@@ -370,10 +457,11 @@ jobs:
         assert job.indexes[0].columns[0].column == "email"
         assert job.indexes[0].columns[0].order == "ASC"
 
-    def test_config_with_multi_column_index(self, tmp_path: Path) -> None:
+    def test_config_with_multi_column_index(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with multi-column index."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: orders
@@ -391,7 +479,6 @@ jobs:
             order: DESC
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.indexes) == 1
@@ -403,10 +490,9 @@ jobs:
         assert index.columns[1].column == "order_date"
         assert index.columns[1].order == "DESC"
 
-    def test_config_with_multiple_indexes(self, tmp_path: Path) -> None:
+    def test_config_with_multiple_indexes(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading config with multiple indexes."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -426,7 +512,6 @@ jobs:
             order: ASC
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.indexes) == 2
@@ -557,10 +642,11 @@ class TestFilenameToColumn:
         with pytest.raises(ValueError, match="exactly one of 'template' or 'regex'"):
             FilenameToColumn(columns=columns)
 
-    def test_config_with_filename_to_column_template(self, tmp_path: Path) -> None:
+    def test_config_with_filename_to_column_template(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with filename_to_column using template."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: observations
@@ -586,7 +672,6 @@ jobs:
           type: varchar(10)
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert job.filename_to_column is not None
@@ -710,10 +795,9 @@ jobs:
 class TestSamplePercentage:
     """Test suite for sample_percentage configuration."""
 
-    def test_config_with_sample_percentage(self, tmp_path: Path) -> None:
+    def test_config_with_sample_percentage(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading config with sample_percentage."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -724,15 +808,15 @@ jobs:
     sample_percentage: 10
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert job.sample_percentage == 10
 
-    def test_config_without_sample_percentage(self, tmp_path: Path) -> None:
+    def test_config_without_sample_percentage(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config without sample_percentage (defaults to None)."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -742,15 +826,15 @@ jobs:
       name: full_name
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert job.sample_percentage is None
 
-    def test_config_with_sample_percentage_100(self, tmp_path: Path) -> None:
+    def test_config_with_sample_percentage_100(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with sample_percentage of 100 (sync all rows)."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -759,15 +843,15 @@ jobs:
     sample_percentage: 100
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert job.sample_percentage == 100
 
-    def test_config_with_sample_percentage_float(self, tmp_path: Path) -> None:
+    def test_config_with_sample_percentage_float(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with float sample_percentage."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -776,7 +860,6 @@ jobs:
     sample_percentage: 12.5
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert job.sample_percentage == 12.5
@@ -891,10 +974,9 @@ jobs:
 class TestColumnLookup:
     """Test suite for column lookup feature."""
 
-    def test_config_with_lookup(self, tmp_path: Path) -> None:
+    def test_config_with_lookup(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading config with lookup dictionary."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: users
@@ -910,7 +992,6 @@ jobs:
           pending: 2
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 1
@@ -960,10 +1041,11 @@ jobs:
         result = col.apply_lookup("active")
         assert result == "active"  # No lookup, so passes through
 
-    def test_config_with_mixed_types_in_lookup(self, tmp_path: Path) -> None:
+    def test_config_with_mixed_types_in_lookup(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test lookup with different value types (string to int, string to string, etc.)."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: products
@@ -986,15 +1068,14 @@ jobs:
           XL: XLG
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 2
 
-        category_col = next(c for c in job.columns if c.csv_column == "category")
+        category_col = job.get_column("category")
         assert category_col.lookup == {"electronics": 100, "clothing": 200, "food": 300}
 
-        size_col = next(c for c in job.columns if c.csv_column == "size")
+        size_col = job.get_column("size")
         assert size_col.lookup == {"S": "SM", "M": "MD", "L": "LG", "XL": "XLG"}
 
     def test_config_lookup_invalid_type(self, tmp_path: Path) -> None:
@@ -1069,10 +1150,9 @@ jobs:
 class TestCustomFunctions:
     """Test suite for custom function and expression column mappings."""
 
-    def test_load_config_with_expression(self, tmp_path: Path) -> None:
+    def test_load_config_with_expression(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading config with inline expression."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: metrics
@@ -1088,7 +1168,6 @@ jobs:
         type: float
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 3
@@ -1103,10 +1182,9 @@ jobs:
         assert custom_col.input_columns == ["consumed", "total_available"]
         assert custom_col.data_type == "float"
 
-    def test_load_config_with_function(self, tmp_path: Path) -> None:
+    def test_load_config_with_function(self, load_config: Callable[[str], CrumpConfig]) -> None:
         """Test loading config with external function reference."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: metrics
@@ -1119,7 +1197,6 @@ jobs:
         input_columns: [value1, value2]
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 1
@@ -1346,10 +1423,11 @@ jobs:
         assert custom_col.function == "my_module.my_function"
         assert custom_col.input_columns == ["x", "y"]
 
-    def test_load_config_with_named_column_transformation(self, tmp_path: Path) -> None:
+    def test_load_config_with_named_column_transformation(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with expression on named CSV column."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: sensors
@@ -1363,7 +1441,6 @@ jobs:
         type: float
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 1
@@ -1410,10 +1487,11 @@ jobs:
         assert temp_col.expression == "float(temperature) * 1.1 + 5"
         assert temp_col.input_columns == ["temperature"]
 
-    def test_load_config_with_polynomial_transformation(self, tmp_path: Path) -> None:
+    def test_load_config_with_polynomial_transformation(
+        self, load_config: Callable[[str], CrumpConfig]
+    ) -> None:
         """Test loading config with polynomial transformation."""
-        config_file = tmp_path / "crump_config.yaml"
-        config_file.write_text("""
+        config = load_config("""
 jobs:
   test_job:
     target_table: data
@@ -1427,7 +1505,6 @@ jobs:
         type: float
 """)
 
-        config = CrumpConfig.from_yaml(config_file)
         job = config.get_job("test_job")
         assert job is not None
         assert len(job.columns) == 1
@@ -1437,3 +1514,106 @@ jobs:
         assert value_col.db_column == "value_calibrated"
         assert value_col.expression == "float(value)**2 * 0.5 + float(value) * 2 + 10"
         assert value_col.input_columns == ["value"]
+
+
+class TestRowTransformer:
+    """Test suite for the csv.reader row transformer."""
+
+    def test_matches_apply_row_transformations(self) -> None:
+        """Test that the transformer gives the same result as the dict-based helper."""
+        from crump.config import (
+            ColumnMapping,
+            FilenameColumnMapping,
+            FilenameToColumn,
+            apply_row_transformations,
+            build_row_transformer,
+        )
+
+        sync_columns = [
+            ColumnMapping("id", "id"),
+            ColumnMapping("status", "status", lookup={"A": "active"}),
+            ColumnMapping(None, "total", expression="int(a) + int(b)", input_columns=["a", "b"]),
+            ColumnMapping("b", "b_copy"),
+        ]
+        filename_to_column = FilenameToColumn(
+            columns={"date": FilenameColumnMapping("date", "file_date")},
+            template="data_[date].csv",
+        )
+        filename_values = {"date": "2024-01-15"}
+        fieldnames = ["id", "status", "a", "b"]
+        row = ["1", "A", "2", "3"]
+
+        columns, transform = build_row_transformer(
+            fieldnames, sync_columns, filename_to_column, filename_values
+        )
+        expected = apply_row_transformations(
+            dict(zip(fieldnames, row, strict=True)),
+            sync_columns,
+            filename_to_column,
+            filename_values,
+        )
+
+        assert columns == list(expected)
+        assert transform(row) == tuple(expected.values())
+        assert expected == {
+            "id": "1",
+            "status": "active",
+            "total": 5,
+            "b_copy": "3",
+            "file_date": "2024-01-15",
+        }
+
+    def test_filename_value_replaces_same_named_column(self) -> None:
+        """Test that a filename column overrides a CSV column with the same db_column."""
+        from crump.config import (
+            ColumnMapping,
+            FilenameColumnMapping,
+            FilenameToColumn,
+            build_row_transformer,
+        )
+
+        columns, transform = build_row_transformer(
+            ["id", "date"],
+            [ColumnMapping("id", "id"), ColumnMapping("date", "date")],
+            FilenameToColumn(
+                columns={"date": FilenameColumnMapping("date", "date")},
+                template="data_[date].csv",
+            ),
+            {"date": "2024-01-15"},
+        )
+
+        assert columns == ["id", "date"]
+        assert transform(["1", "1999-12-31"]) == ("1", "2024-01-15")
+
+    def test_single_plain_column_with_filename_value(self) -> None:
+        """Test a single CSV column followed by a filename value."""
+        from crump.config import (
+            ColumnMapping,
+            FilenameColumnMapping,
+            FilenameToColumn,
+            build_row_transformer,
+        )
+
+        columns, transform = build_row_transformer(
+            ["value", "id"],
+            [ColumnMapping("id", "id")],
+            FilenameToColumn(
+                columns={"date": FilenameColumnMapping("date", "sync_date")},
+                template="data_[date].csv",
+            ),
+            {"date": "2024-01-15"},
+        )
+
+        assert columns == ["id", "sync_date"]
+        assert transform(["x", "7"]) == ("7", "2024-01-15")
+
+    def test_short_row_reads_missing_values_as_none(self) -> None:
+        """Test that missing trailing values read as None, as with DictReader."""
+        from crump.config import ColumnMapping, build_row_transformer
+
+        columns, transform = build_row_transformer(
+            ["id", "name"], [ColumnMapping("id", "id"), ColumnMapping("name", "name")]
+        )
+
+        assert columns == ["id", "name"]
+        assert transform(["1"]) == ("1", None)
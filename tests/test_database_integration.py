@@ -1,6 +1,7 @@
 """Integration tests for database synchronization with SQLite and PostgreSQL."""
 
 import csv
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
@@ -140,6 +141,219 @@ class TestDatabaseIntegration:
         row_result = execute_query(db_url, "SELECT id, value FROM test_data")
         assert row_result[0] == ("1", "updated")  # Value was updated
 
+    def test_duplicate_ids_in_one_csv_last_row_wins(self, tmp_path: Path, db_url: str) -> None:
+        """Test that a batched sync keeps the last row when a CSV repeats an ID."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "data.csv"
+        create_csv_file(
+            csv_file,
+            ["id", "value"],
+            [
+                {"id": "1", "value": "first"},
+                {"id": "2", "value": "only"},
+                {"id": "1", "value": "last"},
+            ],
+        )
+
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "test_dupes", "dupes", {"id": "id"})
+
+        config = CrumpConfig.from_yaml(config_file)
+        job = config.get_job("test_dupes")
+
+        rows_synced = sync_csv_to_db(csv_file, job, db_url)
+        assert rows_synced == 3
+
+        rows = execute_query(db_url, "SELECT id, value FROM dupes ORDER BY id")
+        assert rows == [("1", "last"), ("2", "only")]
+
+    def test_large_batch_upsert(self, tmp_path: Path, db_url: str) -> None:
+        """Test a batch big enough for the bulk path inserts, updates and dedupes."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "data.csv"
+        rows = [{"id": str(i), "value": f"v{i}"} for i in range(1, 2001)]
+        create_csv_file(csv_file, ["id", "value"], rows)
+
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "test_bulk", "bulk", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("test_bulk")
+        assert job is not None
+
+        assert sync_csv_to_db(csv_file, job, db_url) == 2000
+
+        # Resync with changed values and a repeated ID
+        rows = [{"id": str(i), "value": f"w{i}"} for i in range(1, 2001)]
+        rows.append({"id": "7", "value": "last"})
+        create_csv_file(csv_file, ["id", "value"], rows)
+        assert sync_csv_to_db(csv_file, job, db_url) == 2001
+
+        assert execute_query(db_url, "SELECT COUNT(*) FROM bulk") == [(2000,)]
+        assert execute_query(db_url, "SELECT value FROM bulk WHERE id = '7'") == [("last",)]
+        assert execute_query(db_url, "SELECT value FROM bulk WHERE id = '2000'") == [("w2000",)]
+
+    def test_large_batch_upsert_typed_columns(self, tmp_path: Path, db_url: str) -> None:
+        """Test the bulk path stores integer, float and date values with their types."""
+        from tests.test_helpers import create_csv_file
+
+        config_file = tmp_path / "crump_config.yaml"
+        config_file.write_text("""
+jobs:
+  typed_bulk:
+    target_table: typed_bulk
+    id_mapping:
+      id:
+        db_column: id
+        type: integer
+    columns:
+      price:
+        db_column: price
+        type: float
+      stock:
+        db_column: stock
+        type: integer
+      day:
+        db_column: day
+        type: date
+      note: note
+""")
+        job = CrumpConfig.from_yaml(config_file).get_job("typed_bulk")
+        assert job is not None
+
+        csv_file = tmp_path / "typed.csv"
+        rows = [
+            {"id": str(i), "price": f"{i}.5", "stock": str(i * 2), "day": "2024-01-15", "note": ""}
+            for i in range(1500)
+        ]
+        create_csv_file(csv_file, ["id", "price", "stock", "day", "note"], rows)
+        assert sync_csv_to_db(csv_file, job, db_url) == 1500
+
+        result = execute_query(
+            db_url, "SELECT id, price, stock, CAST(day AS TEXT), note FROM typed_bulk WHERE id = 42"
+        )
+        assert result == [(42, 42.5, 84, "2024-01-15", "")]
+
+        # Expression and function columns hand over ints, floats and bools rather
+        # than strings, and the bulk path must store them as small batches do
+        column_types = {
+            "id": "INTEGER",
+            "small": "SMALLINT",
+            "whole": "INTEGER",
+            "big": "BIGINT",
+            "single": "REAL",
+            "double": "DOUBLE PRECISION",
+            "label": "TEXT",
+            "code": "VARCHAR(40)",
+        }
+        values = [
+            {"small": 2.5, "whole": 3.5, "big": -2.5, "single": 7, "double": 2**40},
+            {"small": 7, "whole": -2.5, "big": 1e16, "single": 0.1, "double": 42},
+            {"small": -0.0, "whole": 2**31 - 1, "big": 2**62, "single": 1.5, "double": 1e-5},
+        ]
+        labels = [True, False, 3.0, 100.0, 1e15, 1e-5, -0.0, 7, float("nan"), float("inf")]
+        with DatabaseConnection(db_url) as db:
+            for table, count in (("typed_small", 10), ("typed_bulk_values", 1500)):
+                db.create_table_if_not_exists(table, column_types, ["id"])
+                db.upsert_rows(
+                    table,
+                    ["id"],
+                    [
+                        {
+                            "id": i,
+                            **values[i % len(values)],
+                            "label": labels[i % len(labels)],
+                            "code": labels[-1 - i % len(labels)],
+                        }
+                        for i in range(count)
+                    ],
+                )
+
+        query = "SELECT * FROM {} WHERE id < 10 ORDER BY id"
+        small = execute_query(db_url, query.format("typed_small"))
+        bulk = execute_query(db_url, query.format("typed_bulk_values"))
+        # NaN never equals itself, so compare the rows as text
+        assert [tuple(map(str, row)) for row in bulk] == [tuple(map(str, row)) for row in small]
+        if db_url.startswith("postgresql"):
+            assert bulk[0] == (0, 2, 4, -2, 7.0, 1099511627776.0, "true", "Infinity")
+            assert [row[6] for row in bulk[1:8]] == [
+                "false",
+                "3",
+                "100",
+                "1e+15",
+                "1e-05",
+                "-0",
+                "7",
+            ]
+
+    def test_large_float_expression_into_integer_column(self, tmp_path: Path, db_url: str) -> None:
+        """Test float expression results land in an integer column whatever the batch size."""
+        from tests.test_helpers import create_csv_file
+
+        config_file = tmp_path / "crump_config.yaml"
+        config_file.write_text("""
+jobs:
+  fahrenheit:
+    target_table: fahrenheit
+    id_mapping:
+      id:
+        db_column: id
+        type: integer
+    columns:
+      ~:
+        db_column: temp_f
+        expression: "float(celsius) * 1.8 + 32"
+        input_columns: [celsius]
+        type: integer
+""")
+        job = CrumpConfig.from_yaml(config_file).get_job("fahrenheit")
+        assert job is not None
+
+        results = []
+        for count in (10, 1200):
+            csv_file = tmp_path / f"celsius_{count}.csv"
+            rows = [{"id": str(i), "celsius": f"{i / 4}"} for i in range(count)]
+            create_csv_file(csv_file, ["id", "celsius"], rows)
+            assert sync_csv_to_db(csv_file, job, db_url) == count
+            results.append(
+                execute_query(db_url, "SELECT id, temp_f FROM fahrenheit WHERE id < 10 ORDER BY id")
+            )
+
+        assert results[1] == results[0]
+        assert len(results[0]) == 10
+
+    def test_mid_size_batch_upsert(self, db_url: str) -> None:
+        """Test a batch between the row-by-row and bulk sizes, with a repeated key."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists(
+                "mid_batch", {"id": "INTEGER", "value": "TEXT", "score": "FLOAT"}, ["id"]
+            )
+            rows = [{"id": str(i), "value": f"it's {i}% {{}}", "score": "1.5"} for i in range(200)]
+            rows.append({"id": "7", "value": None, "score": None})
+            db.upsert_rows("mid_batch", ["id"], rows)
+
+        assert execute_query(db_url, "SELECT COUNT(*) FROM mid_batch") == [(200,)]
+        assert execute_query(db_url, "SELECT value, score FROM mid_batch WHERE id = 3") == [
+            ("it's 3% {}", 1.5)
+        ]
+        assert execute_query(db_url, "SELECT value, score FROM mid_batch WHERE id = 7") == [
+            (None, None)
+        ]
+
+    def test_mid_size_batch_float_values(self, db_url: str) -> None:
+        """Test a mid-sized batch stores float values as a small batch does."""
+        with DatabaseConnection(db_url) as db:
+            for table, count in (("floats_small", 10), ("floats_mid", 200)):
+                db.create_table_if_not_exists(
+                    table, {"id": "INTEGER", "whole": "INTEGER", "label": "TEXT"}, ["id"]
+                )
+                rows = [{"id": i, "whole": i + 0.5, "label": i * 0.5} for i in range(count)]
+                db.upsert_rows(table, ["id"], rows)
+
+        query = "SELECT id, whole, label FROM {} WHERE id < 10 ORDER BY id"
+        mid = execute_query(db_url, query.format("floats_mid"))
+        assert mid == execute_query(db_url, query.format("floats_small"))
+
     def test_missing_csv_column_error(self, tmp_path: Path, db_url: str) -> None:
         """Test error when CSV is missing a required column."""
         csv_file = tmp_path / "incomplete.csv"
@@ -278,6 +492,95 @@ jobs:
         assert rows[0] == ("1", "A_updated")
         assert rows[1] == ("2", "B_updated")
 
+    def test_delete_stale_records_returns_deleted_count(self, db_url: str) -> None:
+        """Test that stale deletion reports how many rows it removed."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists(
+                "counted", {"id": "TEXT", "day": "TEXT", "value": "TEXT"}, ["id"]
+            )
+            db.upsert_rows(
+                "counted",
+                ["id"],
+                [
+                    {"id": "1", "day": "mon", "value": "a"},
+                    {"id": "2", "day": "mon", "value": "b"},
+                    {"id": "3", "day": "mon", "value": "c"},
+                    {"id": "4", "day": "tue", "value": "d"},
+                ],
+            )
+
+            deleted = db.delete_stale_records_compound("counted", ["id"], {"day": "mon"}, {("1",)})
+
+        assert deleted == 2
+        assert execute_query(db_url, "SELECT id FROM counted ORDER BY id") == [("1",), ("4",)]
+
+    def test_stage_ids_across_upserts(self, db_url: str) -> None:
+        """Test that IDs staged by several upserts in one transaction add up."""
+        columns = ["id", "day"]
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("staged", {"id": "INTEGER", "day": "TEXT"}, ["id"])
+            assert db.backend is not None
+            db.backend.upsert_rows("staged", columns, ["id"], [(i, "mon") for i in range(6)])
+            with db.transaction():
+                # Batch sizes covering each way PostgreSQL upserts a batch
+                for batch in (
+                    [(1, "mon")],
+                    [(i, "mon") for i in range(100, 200)] + [(3, "mon")],
+                    [(i, "mon") for i in range(1000, 2200)] + [(5, "mon")],
+                ):
+                    db.backend.upsert_rows("staged", columns, ["id"], batch, stage_ids=True)
+                deleted = db.delete_stale_records_compound("staged", ["id"], {"day": "mon"}, None)
+
+        assert deleted == 3
+        assert execute_query(db_url, "SELECT id FROM staged WHERE id < 100 ORDER BY id") == [
+            (1,),
+            (3,),
+            (5,),
+        ]
+
+    def test_delete_stale_records_with_many_integer_ids(self, tmp_path: Path, db_url: str) -> None:
+        """Test stale deletion with more IDs than fit in a parameter list."""
+        from tests.test_helpers import create_csv_file
+
+        config_file = tmp_path / "crump_config.yaml"
+        config_file.write_text(r"""
+jobs:
+  daily_data:
+    target_table: many_ids
+    id_mapping:
+      id:
+        db_column: id
+        type: integer
+    filename_to_column:
+      template: "data_[date].csv"
+      columns:
+        date:
+          db_column: sync_date
+          type: date
+          use_to_delete_old_rows: true
+""")
+        job = CrumpConfig.from_yaml(config_file).get_job("daily_data")
+        assert job is not None
+
+        csv_file = tmp_path / "data_2024-01-15.csv"
+        create_csv_file(
+            csv_file, ["id", "value"], [{"id": str(i), "value": "v"} for i in range(40000)]
+        )
+        filename_values = job.filename_to_column.extract_values_from_filename(csv_file)
+        assert sync_csv_to_db(csv_file, job, db_url, filename_values) == 40000
+
+        # Drop every tenth ID from the file
+        create_csv_file(
+            csv_file,
+            ["id", "value"],
+            [{"id": str(i), "value": "v"} for i in range(40000) if i % 10],
+        )
+        assert sync_csv_to_db(csv_file, job, db_url, filename_values) == 36000
+
+        assert execute_query(db_url, "SELECT COUNT(*) FROM many_ids") == [(36000,)]
+        assert execute_query(db_url, "SELECT COUNT(*) FROM many_ids WHERE id = 10") == [(0,)]
+        assert execute_query(db_url, "SELECT COUNT(*) FROM many_ids WHERE id = 11") == [(1,)]
+
     def test_delete_stale_records_preserves_other_dates(self, tmp_path: Path, db_url: str) -> None:
         """Test that deleting stale records only affects matching date with filename_to_column."""
         config_file = tmp_path / "crump_config.yaml"
@@ -477,7 +780,6 @@ jobs:
         assert rows[0] == ("1", "Alice")
         assert rows[1] == ("2", "Bob")
 
-    @pytest.mark.parametrize("db_url", ["sqlite", "postgres"], indirect=True)
     def test_compound_primary_key(self, tmp_path: Path, db_url: str) -> None:
         """Test syncing with compound primary key."""
         from crump.config import ColumnMapping, CrumpJob
@@ -544,7 +846,6 @@ jobs:
         assert rows[0] == ("1", "A", "15")  # Updated quantity
         assert rows[3] == ("2", "B", "3")  # New row
 
-    @pytest.mark.parametrize("db_url", ["sqlite", "postgres"], indirect=True)
     def test_single_column_index(self, tmp_path: Path, db_url: str) -> None:
         """Test creating single-column index."""
         from crump.config import ColumnMapping, CrumpJob, Index, IndexColumn
@@ -580,7 +881,6 @@ jobs:
         # Sync again - index should not be recreated (no error)
         sync_csv_to_db(csv_file, job, db_url)
 
-    @pytest.mark.parametrize("db_url", ["sqlite", "postgres"], indirect=True)
     def test_multi_column_index(self, tmp_path: Path, db_url: str) -> None:
         """Test creating multi-column index with different sort orders."""
         from crump.config import ColumnMapping, CrumpJob, Index, IndexColumn
@@ -629,7 +929,6 @@ jobs:
         indexes = get_table_indexes(db_url, "orders")
         assert "idx_customer_date" in indexes
 
-    @pytest.mark.parametrize("db_url", ["sqlite", "postgres"], indirect=True)
     def test_multiple_indexes(self, tmp_path: Path, db_url: str) -> None:
         """Test creating multiple indexes on a table."""
         from crump.config import ColumnMapping, CrumpJob, Index, IndexColumn
@@ -1748,3 +2047,331 @@ jobs:
         assert rows_db[0] == ("1", 18.0)  # 0.01*100 + 1.5*10 + 2 = 18
         assert rows_db[1] == ("2", 36.0)  # 0.01*400 + 1.5*20 + 2 = 36
         assert rows_db[2] == ("3", 102.0)  # 0.01*2500 + 1.5*50 + 2 = 102
+
+
+class TestConnectionPooling:
+    """Tests for shared PostgreSQL connection pooling."""
+
+    def test_connections_reuse_shared_pool(self, tmp_path: Path, postgres_db: str) -> None:
+        """Test that repeated syncs against one database share a connection pool."""
+        from crump.database import _get_pg_pool
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "pooled.csv"
+        create_csv_file(csv_file, ["id", "name"], [{"id": "1", "name": "Alice"}])
+
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "pooled", "pooled", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("pooled")
+        assert job is not None
+
+        # Sync several times; each sync borrows a connection and returns it
+        for _ in range(3):
+            assert sync_csv_to_db(csv_file, job, postgres_db) == 1
+
+        pool = _get_pg_pool(postgres_db)
+        assert _get_pg_pool(postgres_db) is pool
+        assert pool.get_stats()["pool_size"] <= pool.max_size
+
+        rows = execute_query(postgres_db, "SELECT id, name FROM pooled")
+        assert rows == [("1", "Alice")]
+
+    def test_connection_uses_injected_pool(self, postgres_db: str) -> None:
+        """Test that a caller-supplied pool is used instead of the shared one."""
+        from psycopg_pool import ConnectionPool
+
+        with ConnectionPool(postgres_db, min_size=1, max_size=1) as pool:
+            with DatabaseConnection(postgres_db, pool=pool) as db:
+                assert db.table_exists("no_such_table") is False
+
+            assert pool.get_stats()["requests_num"] == 1
+
+    def test_shutdown_pools_closes_shared_pools(self, postgres_db: str) -> None:
+        """Test that shutdown_pools closes shared pools and a later sync reopens one."""
+        from crump import shutdown_pools
+        from crump.database import _get_pg_pool
+
+        pool = _get_pg_pool(postgres_db)
+        shutdown_pools()
+        assert pool.closed
+
+        with DatabaseConnection(postgres_db) as db:
+            assert db.table_exists("no_such_table") is False
+        assert _get_pg_pool(postgres_db) is not pool
+
+    def test_prepare_threshold_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that DB_PREPARE_THRESHOLD configures statement preparation."""
+        from crump.database import _pg_prepare_threshold
+
+        monkeypatch.delenv("DB_PREPARE_THRESHOLD", raising=False)
+        assert _pg_prepare_threshold() == 1
+
+        monkeypatch.setenv("DB_PREPARE_THRESHOLD", "5")
+        assert _pg_prepare_threshold() == 5
+
+        monkeypatch.setenv("DB_PREPARE_THRESHOLD", "")
+        assert _pg_prepare_threshold() is None
+
+        monkeypatch.setenv("DB_PREPARE_THRESHOLD", "often")
+        with pytest.raises(ValueError, match="DB_PREPARE_THRESHOLD must be an integer"):
+            _pg_prepare_threshold()
+
+
+class TestSQLitePragmas:
+    """Tests for SQLite connection tuning."""
+
+    def test_file_database_uses_wal(self, tmp_path: Path) -> None:
+        """Test that file-based SQLite databases are opened in WAL mode."""
+        from crump.database import SQLiteBackend
+
+        backend = SQLiteBackend(f"sqlite:///{tmp_path / 'tuned.db'}")
+        try:
+            assert backend.fetchall("PRAGMA journal_mode") == [("wal",)]
+            assert backend.fetchall("PRAGMA busy_timeout") == [(5000,)]
+        finally:
+            backend.close()
+
+    def test_pragmas_override_defaults(self, tmp_path: Path) -> None:
+        """Test that explicit pragmas override the defaults."""
+        from crump.database import SQLiteBackend
+
+        backend = SQLiteBackend(
+            f"sqlite:///{tmp_path / 'tuned.db'}", pragmas={"journal_mode": "DELETE"}
+        )
+        try:
+            assert backend.fetchall("PRAGMA journal_mode") == [("delete",)]
+        finally:
+            backend.close()
+
+    def test_bulk_mode_turns_off_sync_and_restores(self, tmp_path: Path) -> None:
+        """Test that bulk_mode disables fsync only for the duration of the block."""
+        from crump.database import SQLiteBackend
+
+        backend = SQLiteBackend(f"sqlite:///{tmp_path / 'bulk.db'}")
+        try:
+            assert backend.fetchall("PRAGMA synchronous") == [(1,)]
+            with backend.bulk_mode():
+                assert backend.fetchall("PRAGMA synchronous") == [(0,)]
+            assert backend.fetchall("PRAGMA synchronous") == [(1,)]
+        finally:
+            backend.close()
+
+
+class TestTransactions:
+    """Tests for transaction handling in DatabaseConnection."""
+
+    def test_exception_rolls_back_pending_rows(self, db_url: str) -> None:
+        """Test that rows upserted before an exception are not committed."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("txn", {"id": "TEXT", "value": "TEXT"}, ["id"])
+            db.upsert_rows("txn", ["id"], [{"id": "1", "value": "kept"}])
+
+        with pytest.raises(RuntimeError, match="boom"), DatabaseConnection(db_url) as db:
+            db.upsert_rows("txn", ["id"], [{"id": "2", "value": "discarded"}])
+            raise RuntimeError("boom")
+
+        assert execute_query(db_url, "SELECT id, value FROM txn") == [("1", "kept")]
+
+    def test_flush_commits_before_exit(self, db_url: str) -> None:
+        """Test that flush makes pending rows visible to other connections."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("txn", {"id": "TEXT", "value": "TEXT"}, ["id"])
+            db.upsert_rows("txn", ["id"], [{"id": "1", "value": "flushed"}])
+            db.flush()
+            assert execute_query(db_url, "SELECT id, value FROM txn") == [("1", "flushed")]
+
+    def test_failed_sync_rolls_back_schema_changes(self, tmp_path: Path, db_url: str) -> None:
+        """Test that a sync failing after creating its table leaves no table behind."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "data.csv"
+        create_csv_file(csv_file, ["id", "name"], [{"id": "1", "name": "Alice"}])
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "atomic", "atomic", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("atomic")
+        assert job is not None
+
+        def failing_process(*args: object, **kwargs: object) -> None:
+            raise RuntimeError("boom")
+
+        with DatabaseConnection(db_url) as db:
+            db._process_csv_rows = failing_process  # type: ignore[method-assign]
+            with pytest.raises(RuntimeError, match="boom"):
+                db.sync_csv_file(csv_file, job)
+            assert db.table_exists("atomic") is False
+
+
+class TestBulkMode:
+    """Tests for DatabaseConnection.bulk_mode."""
+
+    def test_bulk_mode_commits_on_exit(self, tmp_path: Path, db_url: str) -> None:
+        """Test that a sync inside bulk_mode is committed and visible afterwards."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "bulk.csv"
+        create_csv_file(csv_file, ["id", "name"], [{"id": "1", "name": "Alice"}])
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "bulk", "bulk", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("bulk")
+        assert job is not None
+
+        with DatabaseConnection(db_url) as db, db.bulk_mode():
+            db.sync_csv_file(csv_file, job)
+
+        assert execute_query(db_url, "SELECT id, name FROM bulk") == [("1", "Alice")]
+
+    def test_bulk_mode_rolls_back_on_exception(self, db_url: str) -> None:
+        """Test that work inside bulk_mode is discarded if the block raises."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("bulk", {"id": "TEXT", "value": "TEXT"}, ["id"])
+            db.upsert_rows("bulk", ["id"], [{"id": "1", "value": "kept"}])
+            with pytest.raises(RuntimeError, match="boom"), db.bulk_mode():
+                db.upsert_rows("bulk", ["id"], [{"id": "2", "value": "discarded"}])
+                raise RuntimeError("boom")
+
+        assert execute_query(db_url, "SELECT id, value FROM bulk") == [("1", "kept")]
+
+
+class TestSchemaCache:
+    """Tests for the per-connection schema cache."""
+
+    def test_schema_queried_once_across_files(self, tmp_path: Path, db_url: str) -> None:
+        """Test that syncing several files through one connection reuses the schema."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "cached", "cached", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("cached")
+        assert job is not None
+
+        first = tmp_path / "first.csv"
+        create_csv_file(first, ["id", "name"], [{"id": "1", "name": "Alice"}])
+        second = tmp_path / "second.csv"
+        create_csv_file(second, ["id", "name"], [{"id": "2", "name": "Bob"}])
+
+        # An existing table, so the first sync has to look up its columns
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("cached", {"id": "TEXT", "name": "TEXT"}, ["id"])
+
+        with DatabaseConnection(db_url) as db:
+            assert db.backend is not None
+            backend_lookup = db.backend.get_existing_columns
+            calls = []
+
+            def counting_lookup(table_name: str) -> set[str]:
+                calls.append(table_name)
+                return backend_lookup(table_name)
+
+            db.backend.get_existing_columns = counting_lookup  # type: ignore[method-assign]
+
+            db.sync_csv_file(first, job)
+            db.sync_csv_file(second, job)
+
+        assert calls == ["cached"]
+        assert execute_query(db_url, "SELECT id, name FROM cached ORDER BY id") == [
+            ("1", "Alice"),
+            ("2", "Bob"),
+        ]
+
+    def test_new_table_columns_not_queried(self, db_url: str) -> None:
+        """Test that a table created through the connection is not queried for its columns."""
+        with DatabaseConnection(db_url) as db:
+            assert db.backend is not None
+            db.backend.get_existing_columns = None  # type: ignore[assignment]
+
+            assert db.create_table_if_not_exists("fresh", {"id": "TEXT", "Name": "TEXT"}, ["id"])
+            assert db.get_existing_columns("fresh") == {"id", "name"}
+            assert not db.create_table_if_not_exists("fresh", {"id": "TEXT"}, ["id"])
+
+    def test_added_column_updates_cache(self, db_url: str) -> None:
+        """Test that adding a column keeps the cached schema in step."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("evolving", {"id": "TEXT"}, ["id"])
+            assert db.get_existing_columns("evolving") == {"id"}
+
+            db.add_column("evolving", "Extra", "TEXT")
+
+            assert db.get_existing_columns("evolving") == {"id", "extra"}
+
+    def test_add_columns_adds_all_columns(self, db_url: str) -> None:
+        """Test that several columns can be added at once and are cached."""
+        with DatabaseConnection(db_url) as db:
+            db.create_table_if_not_exists("evolving", {"id": "TEXT"}, ["id"])
+            db.add_columns("evolving", [("first", "TEXT"), ("second", "INTEGER")])
+            assert db.get_existing_columns("evolving") == {"id", "first", "second"}
+
+        assert set(get_table_columns(db_url, "evolving")) == {"id", "first", "second"}
+
+
+class TestUnchangedRows:
+    """Tests for upserts of rows that already exist unchanged."""
+
+    def test_unchanged_row_is_not_rewritten(self, db_url: str) -> None:
+        """Test that upserting identical values leaves the existing row alone."""
+        with DatabaseConnection(db_url) as db:
+            assert db.backend is not None
+            db.create_table_if_not_exists("same", {"id": "TEXT", "value": "TEXT"}, ["id"])
+            db.upsert_rows("same", ["id"], [{"id": "1", "value": "a"}, {"id": "2", "value": None}])
+
+            db.upsert_rows("same", ["id"], [{"id": "1", "value": "a"}, {"id": "2", "value": None}])
+            assert db.backend.cursor.rowcount == 0
+
+            db.upsert_rows("same", ["id"], [{"id": "1", "value": "b"}, {"id": "2", "value": None}])
+            assert db.backend.cursor.rowcount == 1
+
+        assert execute_query(db_url, "SELECT id, value FROM same ORDER BY id") == [
+            ("1", "b"),
+            ("2", None),
+        ]
+
+    def test_key_only_table_resync(self, tmp_path: Path, db_url: str) -> None:
+        """Test resyncing a file whose columns are all part of the key."""
+        from tests.test_helpers import create_config_file, create_csv_file
+
+        csv_file = tmp_path / "keys.csv"
+        create_csv_file(csv_file, ["id"], [{"id": "1"}, {"id": "2"}])
+        config_file = tmp_path / "crump_config.yaml"
+        create_config_file(config_file, "keys", "keys", {"id": "id"})
+        job = CrumpConfig.from_yaml(config_file).get_job("keys")
+        assert job is not None
+
+        assert sync_csv_to_db(csv_file, job, db_url) == 2
+        assert sync_csv_to_db(csv_file, job, db_url) == 2
+
+        assert execute_query(db_url, "SELECT id FROM keys ORDER BY id") == [("1",), ("2",)]
+
+
+class TestPrefetch:
+    """Tests for producing CSV rows on a background thread."""
+
+    def test_items_yielded_in_order(self) -> None:
+        """Test that items come back in order across several batches."""
+        from crump.database import _prefetched
+
+        items = [(i,) for i in range(2500)]
+        assert list(_prefetched(iter(items))) == items
+
+    def test_producer_error_is_raised(self) -> None:
+        """Test that an exception raised while producing reaches the consumer."""
+        from crump.database import _prefetched
+
+        def failing() -> Iterator[tuple[int]]:
+            yield (1,)
+            raise ValueError("bad row")
+
+        rows = _prefetched(failing())
+        with pytest.raises(ValueError, match="bad row"):
+            list(rows)
+
+    def test_close_stops_producer(self) -> None:
+        """Test that closing the iterator early stops the background thread."""
+        import threading
+        from itertools import count
+
+        from crump.database import _prefetched
+
+        rows = _prefetched((i,) for i in count())
+        assert next(rows) == (0,)
+        rows.close()
+
+        assert not any(t.name == "crump-prefetch" for t in threading.enumerate())
@@ -165,3 +165,20 @@ class TestAnalyzeCsvTypes:
 
         assert types["id"] == "integer"
         assert types["value"] == "integer"  # Should ignore empty values
+
+    def test_analyze_nullable_beyond_sample(self, tmp_path: Path) -> None:
+        """Test that an empty value after the sampled rows still marks a column nullable."""
+        from crump.type_detection import analyze_csv_types_and_nullable
+
+        csv_file = tmp_path / "long.csv"
+        with open(csv_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=["id", "value"])
+            writer.writeheader()
+            for i in range(1500):
+                writer.writerow({"id": str(i), "value": str(i)})
+            writer.writerow({"id": "1500", "value": " "})
+
+        result = analyze_csv_types_and_nullable(csv_file)
+
+        assert result["id"] == ("integer", False)
+        assert result["value"] == ("integer", True)